@@ -12,6 +12,7 @@ import time
 from typing import Dict, Any, Optional
 from urllib.parse import urlparse
 from utils.logger import setup_logging
+from utils.html_parser import HTML_PARSER
 from extractors.newspaperarchive_extractor import NewspaperArchiveExtractor
 
 logger = setup_logging(__name__)
@@ -504,7 +505,7 @@ class LAPLExtractor:
             response.raise_for_status()
             
             from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
             
             # Extract headline
             headline = "Unknown Headline"
@@ -681,7 +682,7 @@ class LAPLExtractor:
             logger.info(f"ProQuest response status: {response.status_code}, content length: {len(response.content)}")
             
             from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
             
             # Check if we have the expected ProQuest content structure
             has_docview = bool(soup.select_one('.docview-header, #docview-contents-wrapper, .docView'))
@@ -943,7 +944,7 @@ class LAPLExtractor:
             # Extract data from the loaded page
             from bs4 import BeautifulSoup
             page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            soup = BeautifulSoup(page_source, HTML_PARSER)
             
             # Extract headline
             headline = "Unknown Headline"
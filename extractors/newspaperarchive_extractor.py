@@ -49,6 +49,7 @@ from bs4 import BeautifulSoup
 import signal
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor
 import tempfile
 import shutil
 from pathlib import Path
@@ -64,6 +65,64 @@ logger = logging.getLogger(__name__)
 if not SELENIUM_WIRE_AVAILABLE:
     logger.warning("selenium-wire not available. Download capture features will be disabled.")
 
+# JavaScript fallback for locating download links and large page images when
+# selenium-wire is unavailable. Kept as one constant so the identical source is
+# sent every time (Chrome can reuse its compiled script) and isn't rebuilt per call.
+_DOWNLOAD_CAPTURE_JS = """
+var downloadLinks = [];
+var images = [];
+
+// Look for any download links that might have been created
+var links = document.querySelectorAll('a[href]');
+for (var i = 0; i < links.length; i++) {
+    var href = links[i].href;
+    if (href.includes('download') || href.includes('blob:') || 
+        href.includes('.jpg') || href.includes('.png') || href.includes('.pdf')) {
+        downloadLinks.push(href);
+    }
+}
+
+// Look for images that might be the newspaper page
+var imgs = document.querySelectorAll('img');
+for (var j = 0; j < imgs.length; j++) {
+    var src = imgs[j].src;
+    if (src && !src.includes('icon') && !src.includes('logo') && 
+        (imgs[j].width > 200 || imgs[j].height > 200)) {
+        images.push({
+            src: src,
+            width: imgs[j].width,
+            height: imgs[j].height,
+            naturalWidth: imgs[j].naturalWidth,
+            naturalHeight: imgs[j].naturalHeight
+        });
+    }
+}
+
+return {
+    downloadLinks: downloadLinks,
+    images: images
+};
+"""
+
+# Text of the first element matching each selector, in one round-trip. Each lookup is
+# guarded on its own (a failing selector yields null without affecting the others), and
+# the text approximates Selenium's WebElement.text: empty for unrendered elements, with
+# runs of spaces collapsed and each line trimmed.
+_METADATA_TEXT_JS = """
+return arguments[0].map(function (sel) {
+    try {
+        var el = document.querySelector(sel);
+        if (!el) { return null; }
+        if (!el.getClientRects().length) { return ''; }
+        return el.innerText.split('\\n').map(function (line) {
+            return line.replace(/[ \\t\\u00a0]+/g, ' ').trim();
+        }).join('\\n');
+    } catch (e) {
+        return null;
+    }
+});
+"""
+
 @dataclass
 class ArticleMetadata:
     title: str
@@ -471,72 +530,28 @@ class NewspaperArchiveExtractor:
                             time.sleep(5)
                             
                             # Use JavaScript to find any download-related elements or recently created blob URLs
-                            js_script = """
-                            var downloadLinks = [];
-                            var images = [];
-                            
-                            // Look for any download links that might have been created
-                            var links = document.querySelectorAll('a[href]');
-                            for (var i = 0; i < links.length; i++) {
-                                var href = links[i].href;
-                                if (href.includes('download') || href.includes('blob:') || 
-                                    href.includes('.jpg') || href.includes('.png') || href.includes('.pdf')) {
-                                    downloadLinks.push(href);
-                                }
-                            }
-                            
-                            // Look for images that might be the newspaper page
-                            var imgs = document.querySelectorAll('img');
-                            for (var j = 0; j < imgs.length; j++) {
-                                var src = imgs[j].src;
-                                if (src && !src.includes('icon') && !src.includes('logo') && 
-                                    (imgs[j].width > 200 || imgs[j].height > 200)) {
-                                    images.push({
-                                        src: src,
-                                        width: imgs[j].width,
-                                        height: imgs[j].height,
-                                        naturalWidth: imgs[j].naturalWidth,
-                                        naturalHeight: imgs[j].naturalHeight
-                                    });
-                                }
-                            }
-                            
-                            return {
-                                downloadLinks: downloadLinks,
-                                images: images
-                            };
-                            """
-                            
-                            result = driver.execute_script(js_script)
+                            result = driver.execute_script(_DOWNLOAD_CAPTURE_JS)
                             logger.info(f"JavaScript found {len(result.get('downloadLinks', []))} download links and {len(result.get('images', []))} images")
                             
-                            # Try to download from any found links
-                            for link in result.get('downloadLinks', []):
-                                try:
-                                    logger.info(f"Attempting to download from JS-found link: {link[:100]}")
-                                    # Session already has realistic headers set
-                                    response = self.session.get(link, timeout=30)
-                                    
-                                    if response.status_code == 200 and len(response.content) > 200000:  # At least 200KB for quality consistency
-                                        content_type = response.headers.get('content-type', 'image/jpeg')
-                                        file_extension = 'jpg'
-                                        if 'png' in content_type.lower():
-                                            file_extension = 'png'
-                                        elif 'pdf' in content_type.lower():
-                                            file_extension = 'pdf'
-                                        
-                                        downloaded_files.append({
-                                            'url': link,
-                                            'content': response.content,
-                                            'content_type': content_type,
-                                            'headers': dict(response.headers),
-                                            'filename': f"newspaperarchive_js_{int(time.time())}.{file_extension}"
-                                        })
-                                        logger.info(f"Successfully downloaded via JavaScript method: {len(response.content)} bytes")
-                                        break  # Stop after first successful download
-                                        
-                                except Exception as e:
-                                    logger.warning(f"Failed to download JS link {link}: {e}")
+                            # Probe all found links at once, then download the first good one
+                            downloaded = self._download_first_good_link(result.get('downloadLinks', []))
+                            if downloaded:
+                                link, response = downloaded
+                                content_type = response.headers.get('content-type', 'image/jpeg')
+                                file_extension = 'jpg'
+                                if 'png' in content_type.lower():
+                                    file_extension = 'png'
+                                elif 'pdf' in content_type.lower():
+                                    file_extension = 'pdf'
+                                
+                                downloaded_files.append({
+                                    'url': link,
+                                    'content': response.content,
+                                    'content_type': content_type,
+                                    'headers': dict(response.headers),
+                                    'filename': f"newspaperarchive_js_{int(time.time())}.{file_extension}"
+                                })
+                                logger.info(f"Successfully downloaded via JavaScript method: {len(response.content)} bytes")
                             
                             # If no download links worked, try the images
                             if not downloaded_files:
@@ -617,10 +632,14 @@ class NewspaperArchiveExtractor:
                     if not use_selenium_wire:
                         # Fallback: look for direct download links and try to capture them
                         logger.info("Trying fallback download link detection...")
-                        download_links = driver.find_elements(By.CSS_SELECTOR, self.css_selectors['download_link'])
-                        for link in download_links:
+                        # Read every candidate href in one script call instead of a
+                        # WebDriver round-trip per link element
+                        download_urls = driver.execute_script(
+                            "return Array.from(document.querySelectorAll(arguments[0])).map(e => e.href || e.getAttribute('href'));",
+                            self.css_selectors['download_link']
+                        ) or []
+                        for download_url in download_urls:
                             try:
-                                download_url = link.get_attribute('href')
                                 if download_url:
                                     # Try to download directly
                                     response = self.session.get(download_url, timeout=30)
@@ -675,6 +694,49 @@ class NewspaperArchiveExtractor:
             logger.error(f"Unexpected error during NewspaperArchive extraction: {e}")
             return {'success': False, 'error': f'Unexpected error: {str(e)}'}
 
+    def _download_first_good_link(self, urls: List[str], min_bytes: int = 200000, timeout: int = 30,
+                                  probe_timeout: int = 10) -> Optional[Tuple[str, requests.Response]]:
+        """Return (url, response) for the first candidate URL, in list order, that yields a good download.
+        
+        A download counts as good when it is HTTP 200 and larger than min_bytes (smaller
+        files are compressed previews). All candidates are first probed concurrently with
+        HEAD requests; only links whose HEAD returns 200 with a Content-Length at or below
+        min_bytes are dropped. Failed or rejected HEADs (403/405 etc.) keep the link,
+        since some servers only answer GET. The rest are fetched in full, one at a
+        time, until one passes.
+        """
+        if not urls:
+            return None
+        
+        def probe(link: str) -> bool:
+            try:
+                # Session already has realistic headers set
+                head = self.session.head(link, timeout=probe_timeout, allow_redirects=True)
+            except requests.RequestException as e:
+                logger.debug(f"HEAD probe failed for JS link {link}, will try GET: {e}")
+                return True
+            if head.status_code != 200:
+                # Many servers reject HEAD but serve GET; let the full GET decide
+                return True
+            # Servers that omit the length are not ruled out either
+            length = head.headers.get('content-length')
+            return not (length and length.isdigit() and int(length) <= min_bytes)
+        
+        with ThreadPoolExecutor(max_workers=min(len(urls), 5)) as executor:
+            passed = list(executor.map(probe, urls))
+        
+        for link, ok in zip(urls, passed):
+            if not ok:
+                continue
+            try:
+                logger.info(f"Attempting to download from JS-found link: {link[:100]}")
+                response = self.session.get(link, timeout=timeout)
+                if response.status_code == 200 and len(response.content) > min_bytes:
+                    return link, response
+            except Exception as e:
+                logger.warning(f"Failed to download JS link {link}: {e}")
+        return None
+
     def _extract_metadata(self, driver, url: str, player_name: Optional[str]) -> Dict:
         """Extract article metadata using placeholder selectors"""
         metadata = {
@@ -687,33 +749,37 @@ class NewspaperArchiveExtractor:
         }
         
         try:
+            # Look up every metadata selector in one script call rather than a
+            # find_element + .text round-trip per field (each field fails independently)
+            texts = driver.execute_script(
+                _METADATA_TEXT_JS,
+                [self.css_selectors[key] for key in ('article_title', 'article_date', 'newspaper_name', 'article_content')]
+            ) or [None] * 4
+            title_text, date_text, newspaper_text, content_text = texts
+            
             # Extract title (placeholder selector)
-            try:
-                title_elem = driver.find_element(By.CSS_SELECTOR, self.css_selectors['article_title'])
-                metadata['title'] = title_elem.text.strip()
-            except:
+            if title_text is not None:
+                metadata['title'] = title_text.strip()
+            else:
                 logger.warning("Could not extract article title")
             
             # Extract date (placeholder selector)
-            try:
-                date_elem = driver.find_element(By.CSS_SELECTOR, self.css_selectors['article_date'])
-                metadata['date'] = date_elem.text.strip()
-            except:
+            if date_text is not None:
+                metadata['date'] = date_text.strip()
+            else:
                 logger.warning("Could not extract article date")
             
             # Extract newspaper name (placeholder selector)
-            try:
-                newspaper_elem = driver.find_element(By.CSS_SELECTOR, self.css_selectors['newspaper_name'])
-                metadata['newspaper'] = newspaper_elem.text.strip()
-            except:
+            if newspaper_text is not None:
+                metadata['newspaper'] = newspaper_text.strip()
+            else:
                 logger.warning("Could not extract newspaper name")
             
             # Extract content preview (placeholder selector)
-            try:
-                content_elem = driver.find_element(By.CSS_SELECTOR, self.css_selectors['article_content'])
-                content_text = content_elem.text.strip()
+            if content_text is not None:
+                content_text = content_text.strip()
                 metadata['content_preview'] = content_text[:500] + "..." if len(content_text) > 500 else content_text
-            except:
+            else:
                 logger.warning("Could not extract article content")
                 
         except Exception as e:
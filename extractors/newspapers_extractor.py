@@ -5,6 +5,8 @@ import streamlit as st
 from utils.storage_manager import StorageManager
 from utils.credential_manager import CredentialManager
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
@@ -54,15 +56,20 @@ from dataclasses import dataclass
 from typing import List, Dict, Optional, Tuple
 import logging
 from bs4 import BeautifulSoup
+import soupsieve
 import signal
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from contextlib import contextmanager
 import tempfile
 import shutil
 from pathlib import Path
 
 # Import paragraph formatter for text processing
 from utils.paragraph_formatter import format_article_paragraphs
+from utils.html_parser import HTML_PARSER
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(name)s - %(message)s')
@@ -72,6 +79,96 @@ logger = logging.getLogger(__name__)
 if not SELENIUM_WIRE_AVAILABLE:
     logger.warning("selenium-wire not available. Download capture features will be disabled.")
 
+# Browser identity applied once to the shared requests session (safe for any host)
+_SESSION_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+# Page-navigation headers sent only with newspapers.com search requests
+_SEARCH_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Referer': 'https://www.newspapers.com/',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# Case-insensitive page text checks, compiled once so the (large) page source is
+# scanned in a single pass without building a lowercased copy
+PAYWALL_INDICATORS = ['subscription', 'sign in to view', 'upgrade your access', 'paywall']
+_PAYWALL_RE = re.compile('|'.join(map(re.escape, PAYWALL_INDICATORS)), re.IGNORECASE)
+_LOGIN_ERROR_RE = re.compile(r'incorrect email or password|invalid login', re.IGNORECASE)
+
+_DEBUG_DIR = "debug_html"
+
+# Reference count for _single_thread_tesseract, so overlapping OCR batches share one setting
+_OMP_LIMIT_LOCK = threading.Lock()
+_omp_limit_users = 0
+
+
+@contextmanager
+def _single_thread_tesseract():
+    """Limit tesseract processes spawned inside the block to one OpenMP thread each.
+    
+    pytesseract has no per-call environment hook, so OMP_THREAD_LIMIT=1 is set in
+    os.environ (inherited by the spawned processes) only while a parallel OCR batch
+    runs, and removed when the last overlapping batch finishes. An OMP_THREAD_LIMIT
+    set by the deployment is left untouched.
+    """
+    global _omp_limit_users
+    with _OMP_LIMIT_LOCK:
+        if _omp_limit_users == 0 and 'OMP_THREAD_LIMIT' in os.environ:
+            owned = False
+        else:
+            owned = True
+            if _omp_limit_users == 0:
+                os.environ['OMP_THREAD_LIMIT'] = '1'
+            _omp_limit_users += 1
+    try:
+        yield
+    finally:
+        if owned:
+            with _OMP_LIMIT_LOCK:
+                _omp_limit_users -= 1
+                if _omp_limit_users == 0:
+                    os.environ.pop('OMP_THREAD_LIMIT', None)
+
+# Search-result card fields, each a list of selectors compiled once and tried in
+# priority order (a comma-joined selector would pick the first match in document order)
+_RESULT_TITLE_SELECTORS = tuple(soupsieve.compile(s) for s in ('h3', '.title', '.headline', 'a'))
+_RESULT_DATE_SELECTORS = tuple(soupsieve.compile(s) for s in ('.date', '.published', '[data-date]'))
+_RESULT_NEWSPAPER_SELECTORS = tuple(soupsieve.compile(s) for s in ('.newspaper', '.source', '.publication'))
+_RESULT_PREVIEW_SELECTORS = tuple(soupsieve.compile(s) for s in ('.preview', '.snippet', '.excerpt', 'p'))
+_RESULT_LINK_SELECTOR = soupsieve.compile('a[href]')
+
+# Every Cloudflare challenge probe in one script: one WebDriver round-trip, and the
+# page source never has to be shipped back to Python just to search it
+_CLOUDFLARE_CHECK_JS = """
+if (document.querySelector('iframe[src*="challenges.cloudflare.com/turnstile"]')) return 'turnstile_iframe';
+if (document.querySelector('#cf-challenge-body, .cf-turnstile')) return 'challenge_element';
+if (/verify you are human/i.test(document.documentElement.outerHTML)) return 'verify_text';
+return null;
+"""
+
+def _set_cookies_via_cdp(driver, cookies: Dict[str, str], domain: str = '.newspapers.com') -> bool:
+    """Install all cookies in one DevTools call; returns False if the driver has no CDP (caller falls back to add_cookie)"""
+    if not hasattr(driver, 'execute_cdp_cmd'):
+        return False
+    try:
+        driver.execute_cdp_cmd('Network.setCookies', {
+            'cookies': [
+                {'name': name, 'value': value, 'domain': domain, 'path': '/'}
+                for name, value in cookies.items()
+            ]
+        })
+        logger.info(f"Set {len(cookies)} cookies via CDP Network.setCookies")
+        return True
+    except Exception as e:
+        logger.warning(f"CDP cookie injection failed, falling back to add_cookie: {e}")
+        return False
+
 @dataclass
 class ArticleMetadata:
     title: str
@@ -98,6 +195,7 @@ class SeleniumLoginManager:
         self.driver = None
         self.cookies = {}
         self.last_login = None
+        self._debug_dir_ready = False
         self.login_credentials = None
         self.is_replit = 'REPL_ID' in os.environ or 'REPL_SLUG' in os.environ
         self.is_render = 'RENDER' in os.environ or 'RENDER_SERVICE_ID' in os.environ
@@ -474,8 +572,7 @@ class SeleniumLoginManager:
                 WebDriverWait(self.driver, wait_timeout).until(
                     lambda d: (
                         d.execute_script("return window.ncom && window.ncom.statsiguser && window.ncom.statsiguser.custom && window.ncom.statsiguser.custom.isloggedin;") or
-                        "incorrect email or password" in d.page_source.lower() or
-                        "invalid login" in d.page_source.lower()
+                        _LOGIN_ERROR_RE.search(d.page_source)
                     )
                 )
                 
@@ -490,8 +587,7 @@ class SeleniumLoginManager:
             except TimeoutException:
                 logger.warning("Login timed out during post-submission wait or 'isloggedin' check.")
                 # Attempt to check if an error message for incorrect credentials appeared
-                if "incorrect email or password" in self.driver.page_source.lower() or \
-                   "invalid login" in self.driver.page_source.lower():
+                if _LOGIN_ERROR_RE.search(self.driver.page_source):
                     st.error("Login failed: Incorrect email or password. Please verify your credentials.")
                 elif self._is_cloudflare_captcha_present(): # Check for CAPTCHA after timeout
                     logger.error("Cloudflare CAPTCHA detected after login attempt. This is the blocker.")
@@ -538,17 +634,10 @@ class SeleniumLoginManager:
     def _is_cloudflare_captcha_present(self) -> bool:
         """Checks for common Cloudflare CAPTCHA elements."""
         try:
-            # Check for the cf-turnstile iframe or its parent container
-            if self.driver.find_elements(By.CSS_SELECTOR, 'iframe[src*="challenges.cloudflare.com/turnstile"]'):
-                logger.debug("Cloudflare Turnstile iframe found.")
-                return True
-            if self.driver.find_elements(By.ID, 'cf-challenge-body') or \
-               self.driver.find_elements(By.CLASS_NAME, 'cf-turnstile'):
-                logger.debug("Cloudflare challenge body or turnstile element found.")
-                return True
-            # Check for the "Verify you are human" text
-            if "verify you are human" in self.driver.page_source.lower():
-                logger.debug("Cloudflare 'verify you are human' text found in page source.")
+            # Turnstile iframe, challenge body/turnstile container, or "Verify you are human" text
+            indicator = self.driver.execute_script(_CLOUDFLARE_CHECK_JS)
+            if indicator:
+                logger.debug(f"Cloudflare challenge detected: {indicator}")
                 return True
             return False
         except Exception as e:
@@ -556,38 +645,48 @@ class SeleniumLoginManager:
             return False
 
     def _save_debug_html(self, driver, url: str) -> None:
-        """Saves debug HTML and a summary of the page."""
+        """Saves debug HTML and a summary of the page (only with DEBUG logging or NEWSPAPERS_DEBUG set)."""
+        # Pulling page_source and writing multi-MB files is pure overhead in normal runs
+        if not logger.isEnabledFor(logging.DEBUG) and not os.getenv('NEWSPAPERS_DEBUG'):
+            return
+        
         try:
-            debug_dir = "debug_html"
-            os.makedirs(debug_dir, exist_ok=True)
+            # Created on first use only, so normal runs don't leave an empty directory behind
+            if not self._debug_dir_ready:
+                os.makedirs(_DEBUG_DIR, exist_ok=True)
+                self._debug_dir_ready = True
             
             page_html = driver.page_source
             
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            url_hash = hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
+            now = datetime.now()
+            timestamp = now.strftime('%Y%m%d_%H%M%S')
             filename = f"debug_page_{timestamp}_{url_hash}.html"
-            filepath = os.path.join(debug_dir, filename)
+            filepath = os.path.join(_DEBUG_DIR, filename)
             
-            with open(filepath, 'w', encoding='utf-8') as f:
+            # Write to a temp file and swap it in so a crash never leaves a half-written dump
+            tmp_filepath = f"{filepath}.tmp"
+            with open(tmp_filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
                 f.write(page_html)
+            os.replace(tmp_filepath, filepath)
             
             logger.info(f"Debug HTML saved to {filepath}")
             
             # Also save a summary
             summary_filename = f"debug_summary_{timestamp}_{url_hash}.txt"
-            summary_filepath = os.path.join(debug_dir, summary_filename)
+            summary_filepath = os.path.join(_DEBUG_DIR, summary_filename)
             
             with open(summary_filepath, 'w', encoding='utf-8') as f:
                 f.write(f"URL: {url}\n")
-                f.write(f"Timestamp: {datetime.now().isoformat()}\n")
+                f.write(f"Timestamp: {now.isoformat()}\n")
                 f.write(f"Page Title: {driver.title}\n")
                 f.write(f"Current URL: {driver.current_url}\n")
                 f.write(f"Page source length: {len(page_html)} characters\n")
                 f.write(f"HTML file: {filename}\n")
                 
                 # Check for common paywall indicators
-                paywall_indicators = ['subscription', 'sign in to view', 'upgrade your access', 'paywall']
-                found_indicators = [ind for ind in paywall_indicators if ind in page_html.lower()]
+                matched = {m.group(0).lower() for m in _PAYWALL_RE.finditer(page_html)}
+                found_indicators = [ind for ind in PAYWALL_INDICATORS if ind in matched]
                 if found_indicators:
                     f.write(f"Paywall indicators found: {found_indicators}\n")
                 else:
@@ -604,8 +703,22 @@ class AutoCookieManager:
     def __init__(self):
         self.cookies = {}
         self.session = requests.Session()
+        self.session.headers.update(_SESSION_HEADERS)
+        # Keep a larger keep-alive pool per host and retry transient gateway errors
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.last_extraction = None
         self.selenium_login_manager = SeleniumLoginManager() # Renamed to avoid confusion
+        # A passing authentication test is trusted for a while so batch runs don't
+        # reload the home page in Selenium before every article
+        self.auth_check_ttl = 600  # seconds
+        self._last_auth_check: Optional[float] = None  # monotonic time of the last passing test; None = never
+        self._auth_check_lock = threading.Lock()
         
     def set_login_credentials(self, email: str, password: str):
         """Set login credentials for Selenium authentication"""
@@ -625,6 +738,9 @@ class AutoCookieManager:
             self.cookies = self.selenium_login_manager.cookies
             self.last_extraction = datetime.now()
 
+            # Fresh login invalidates any cached authentication check
+            self._last_auth_check = None
+            
             # Transfer Selenium cookies to requests.Session
             self.session.cookies.clear()
             for name, value in self.cookies.items():
@@ -645,21 +761,22 @@ class AutoCookieManager:
                 return False
             # If a new driver is initialized, ensure cookies are loaded into it.
             driver = self.selenium_login_manager.driver
-            driver.get('https://www.newspapers.com/') # Go to base domain to set cookies
             
             if not self.cookies:
                 logger.error("No cookies available for authentication test")
                 return False
                 
             logger.info(f"Adding {len(self.cookies)} cookies to driver for authentication test")
-            for name, value in self.cookies.items():
-                try:
-                    cookie_domain = '.newspapers.com'
-                    driver.add_cookie({'name': name, 'value': value, 'domain': cookie_domain, 'path': '/'})
-                    logger.debug(f"Added cookie: {name}")
-                except Exception as e:
-                    logger.warning(f"Could not add cookie {name} to driver for test: {e}")
-            time.sleep(2) # Give browser a moment to apply cookies
+            if not _set_cookies_via_cdp(driver, self.cookies):
+                driver.get('https://www.newspapers.com/') # Go to base domain to set cookies
+                for name, value in self.cookies.items():
+                    try:
+                        cookie_domain = '.newspapers.com'
+                        driver.add_cookie({'name': name, 'value': value, 'domain': cookie_domain, 'path': '/'})
+                        logger.debug(f"Added cookie: {name}")
+                    except Exception as e:
+                        logger.warning(f"Could not add cookie {name} to driver for test: {e}")
+                time.sleep(2) # Give browser a moment to apply cookies
 
         driver = self.selenium_login_manager.driver
 
@@ -692,11 +809,19 @@ class AutoCookieManager:
                 st.error("Failed to re-authenticate. Please check credentials in sidebar.")
                 return False
         
-        if not self.test_authentication():
-            logger.warning("Existing cookies failed authentication test, re-authenticating.")
-            if not self.auto_authenticate():
-                st.error("Failed to re-authenticate after test failure. Please check credentials in sidebar.")
-                return False
+        with self._auth_check_lock:
+            if (self._last_auth_check is not None
+                    and time.monotonic() - self._last_auth_check < self.auth_check_ttl):
+                logger.info("Authentication verified recently, skipping re-test.")
+                return True
+            
+            if not self.test_authentication():
+                logger.warning("Existing cookies failed authentication test, re-authenticating.")
+                if not self.auto_authenticate():
+                    st.error("Failed to re-authenticate after test failure. Please check credentials in sidebar.")
+                    return False
+            
+            self._last_auth_check = time.monotonic()
         
         logger.info("Authentication is current and valid.")
         return True
@@ -707,6 +832,18 @@ class NewspaperImageProcessor:
     def __init__(self):
         self.min_article_area = 30000  # Minimum area for article detection
         self.text_confidence_threshold = 30  # Minimum OCR confidence
+        self.max_ocr_dimension = 2500  # Larger crops are downscaled before OCR
+    
+    @staticmethod
+    def _to_gray_array(image: Image.Image):
+        """Grayscale ndarray straight from the PIL buffer (no intermediate BGR copy)"""
+        if image.mode not in ('RGB', 'RGBA', 'L'):
+            image = image.convert('RGB')
+        arr = np.asarray(image)
+        if arr.ndim == 2:
+            return arr
+        code = cv2.COLOR_RGBA2GRAY if arr.shape[2] == 4 else cv2.COLOR_RGB2GRAY
+        return cv2.cvtColor(arr, code)
     
     def detect_newspaper_clipping_borders(self, image: Image.Image) -> Tuple[int, int, int, int]:
         """
@@ -721,8 +858,7 @@ class NewspaperImageProcessor:
             return (0, 0, image.width, image.height)
         
         # Convert PIL image to OpenCV format
-        img_cv = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-        gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
+        gray = self._to_gray_array(image)
         
         # Method 1: Edge detection approach
         try:
@@ -895,13 +1031,17 @@ class NewspaperImageProcessor:
             # Return full image as single region
             return [(0, 0, image.width, image.height)]
             
-        img_cv = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-        gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
+        gray = self._to_gray_array(image)
         
-        edges = cv2.Canny(gray, 50, 150, apertureSize=3)
+        # Adaptive thresholding copes with uneven scan illumination far better than a
+        # global threshold/edge pass, so real articles come out as solid blobs
+        binary = cv2.adaptiveThreshold(
+            gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY_INV, 31, 10
+        )
         
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
-        morphed = cv2.morphologyEx(edges, cv2.MORPH_CLOSE, kernel)
+        # Wide kernel bridges words and lines into paragraph/column blobs
+        kernel = np.ones((5, 25), np.uint8)
+        morphed = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
         
         contours, _ = cv2.findContours(
             morphed, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
@@ -911,29 +1051,36 @@ class NewspaperImageProcessor:
         
         article_regions = []
         min_area = 5000
+        max_regions = 20
+        
+        # Compute all areas up front and only visit large contours, biggest first, so we
+        # can stop as soon as we have as many regions as we will ever return
+        areas = np.fromiter((cv2.contourArea(c) for c in contours), dtype=np.float32, count=len(contours))
+        keep = np.nonzero(areas > min_area)[0]
+        keep = keep[np.argsort(areas[keep])[::-1]]
         
-        for i, contour in enumerate(contours):
-            area = cv2.contourArea(contour)
+        for i in keep:
+            area = areas[i]
+            x, y, w, h = cv2.boundingRect(contours[i])
             
-            if area > min_area:
-                x, y, w, h = cv2.boundingRect(contour)
-                
-                padding = 10
-                x = max(0, x - padding)
-                y = max(0, y - padding)
-                w = min(image.width - x, w + 2 * padding)
-                h = min(image.height - y, h + 2 * padding)
-                
-                aspect_ratio = h / w if w > 0 else 0
-                
-                if 0.1 < aspect_ratio < 10.0 and w > 100 and h > 100:
-                    article_regions.append((x, y, w, h))
-                    logger.debug(f"Contour {i}: area={area}, bbox=({x},{y},{w},{h}), aspect={aspect_ratio:.2f}")
-                else:
-                    logger.debug(f"Rejected contour {i}: area={area}, bbox=({x},{y},{w},{h}), aspect={aspect_ratio:.2f}")
+            padding = 10
+            x = max(0, x - padding)
+            y = max(0, y - padding)
+            w = min(image.width - x, w + 2 * padding)
+            h = min(image.height - y, h + 2 * padding)
+            
+            aspect_ratio = h / w if w > 0 else 0
+            
+            if 0.1 < aspect_ratio < 10.0 and w > 100 and h > 100:
+                article_regions.append((x, y, w, h))
+                logger.debug(f"Contour {i}: area={area}, bbox=({x},{y},{w},{h}), aspect={aspect_ratio:.2f}")
+                if len(article_regions) >= max_regions:
+                    break
+            else:
+                logger.debug(f"Rejected contour {i}: area={area}, bbox=({x},{y},{w},{h}), aspect={aspect_ratio:.2f}")
         
         if len(article_regions) < 3:
-            logger.info("Few regions found with edge detection, trying simpler grid approach.")
+            logger.info("Few regions found with contour detection, trying simpler grid approach.")
             
             grid_regions = []
             
@@ -955,7 +1102,7 @@ class NewspaperImageProcessor:
             article_regions.extend(grid_regions)
         
         article_regions.sort(key=lambda r: r[2] * r[3], reverse=True)
-        final_regions = article_regions[:20]
+        final_regions = article_regions[:max_regions]
         
         logger.info(f"Returning {len(final_regions)} article regions for processing.")
         return final_regions
@@ -985,10 +1132,10 @@ class NewspaperImageProcessor:
             regions.extend(expanded_regions)
             
             # Score each region based on how well it matches our article content
-            for region in regions[:15]:  # Check more regions per image
+            regions = regions[:15]  # Check more regions per image
+            ocr_results = self.extract_text_batch_parallel(image, regions)
+            for region, (region_text, confidence) in zip(regions, ocr_results):
                 try:
-                    region_text, confidence = self.extract_text_with_confidence(image, region)
-                    
                     if len(region_text.strip()) < 10:  # Skip very short text regions
                         continue
                     
@@ -1417,9 +1564,9 @@ class NewspaperImageProcessor:
     def save_png_to_storage(self, image: Image.Image, filename: str, storage_manager) -> bool:
         """Save image as PNG to Replit storage"""
         try:
-            # Convert image to PNG bytes
+            # Convert image to PNG bytes (fast zlib level; optimize=True re-encodes several times)
             png_buffer = io.BytesIO()
-            image.save(png_buffer, format='PNG', optimize=True)
+            image.save(png_buffer, format='PNG', optimize=False, compress_level=1)
             png_data = png_buffer.getvalue()
             
             # Ensure filename has .png extension
@@ -1449,6 +1596,11 @@ class NewspaperImageProcessor:
             cropped = image.crop((x, y, x + w, y + h))
             logger.debug(f"Cropped region to size: {cropped.size}")
             
+            # Tesseract gains nothing from very high DPI crops; its runtime scales with pixels
+            if max(cropped.size) > self.max_ocr_dimension:
+                cropped.thumbnail((self.max_ocr_dimension, self.max_ocr_dimension), Image.LANCZOS)
+                logger.debug(f"Downscaled crop for OCR to: {cropped.size}")
+            
             enhanced = self.enhance_image_quality(cropped)
             logger.debug(f"Enhanced image for OCR, mode: {enhanced.mode}")
             
@@ -1520,6 +1672,21 @@ class NewspaperImageProcessor:
         except Exception as e:
             logger.error(f"OCR extraction failed: {e}", exc_info=True)
             return "", 0.0
+    
+    def extract_text_batch_parallel(self, image: Image.Image, regions: List[Tuple[int, int, int, int]]) -> List[Tuple[str, float]]:
+        """OCR several regions concurrently, returning (text, confidence) in the same order as regions"""
+        if not regions:
+            return []
+        
+        # Each pytesseract call runs in its own tesseract process, so threads overlap the
+        # native work; each process is pinned to one OpenMP thread to avoid oversubscription.
+        # Side effect: OMP_THREAD_LIMIT=1 is in os.environ for the duration of the batch, so
+        # any other subprocess started meanwhile inherits it too.
+        max_workers = min(4, os.cpu_count() or 1, len(regions))
+        logger.debug(f"Running OCR on {len(regions)} regions with {max_workers} workers")
+        
+        with _single_thread_tesseract(), ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda region: self.extract_text_with_confidence(image, region), regions))
 
 
 class ContentAnalyzer:
@@ -1535,19 +1702,24 @@ class ContentAnalyzer:
         }
         
         self.negative_indicators = ['loss', 'defeat', 'injury', 'suspension', 'scandal', 'controversy', 'arrest', 'fired', 'benched']
+        
+        # Flattened keyword lookup: each keyword maps to how many categories list it,
+        # so a single hash lookup per word gives the same totals as scanning every category
+        self._keyword_weight = {}
+        for keywords in self.sports_keywords.values():
+            for keyword in keywords:
+                self._keyword_weight[keyword] = self._keyword_weight.get(keyword, 0) + 1
+        self._all_sports = frozenset(self._keyword_weight)
+        
+        self._player_variants = {}
     
     def analyze_sports_relevance(self, text: str) -> Tuple[bool, float, List[str]]:
         """Determine if text is sports-related and get relevance score"""
         text_lower = text.lower()
         words = re.findall(r'\b\w+\b', text_lower)
         
-        sport_matches = []
-        total_matches = 0
-        
-        for category, keywords in self.sports_keywords.items():
-            matches = [word for word in words if word in keywords]
-            sport_matches.extend(matches)
-            total_matches += len(matches)
+        sport_matches = [word for word in words if word in self._all_sports]
+        total_matches = sum(self._keyword_weight[word] for word in sport_matches)
         
         relevance_score = min(total_matches / max(len(words), 1) * 10, 1.0)
         
@@ -1555,42 +1727,57 @@ class ContentAnalyzer:
         
         return is_sports_related, relevance_score, sport_matches
     
-    def check_player_mentions(self, text: str, player_name: str) -> Tuple[bool, List[str]]:
-        """Check for player name mentions and variations"""
-        text_lower = text.lower()
-        player_lower = player_name.lower()
+    def player_name_variants(self, player_name: str) -> Tuple[Tuple[str, str], ...]:
+        """(mention, lowercase substring) pairs for a player's name variations, built once per player
         
-        name_parts = player_lower.split()
-        
-        mentions = []
-        
-        if player_lower in text_lower:
-            mentions.append(player_name)
+        Returned in the order mentions are reported: full name, last name, first name
+        plus last initial.
+        """
+        variants = self._player_variants.get(player_name)
+        if variants is not None:
+            return variants
         
+        player_lower = player_name.lower()
+        name_parts = player_lower.split()
+        variants = [(player_name, player_lower)]
         if len(name_parts) > 1:
             last_name = name_parts[-1]
-            if last_name in text_lower and len(last_name) > 2:
-                mentions.append(last_name)
+            if len(last_name) > 2:
+                variants.append((last_name, last_name))
+            first_last_initial = f"{name_parts[0]} {last_name[0]}"
+            variants.append((first_last_initial, first_last_initial))
+        
+        variants = tuple(variants)
+        self._player_variants[player_name] = variants
+        return variants
+    
+    def check_player_mentions(self, text: str, player_name: str) -> Tuple[bool, List[str]]:
+        """Check for player name mentions and variations
         
-        if len(name_parts) > 1:
-            first_last_initial = f"{name_parts[0]} {name_parts[-1][0]}"
-            if first_last_initial in text_lower:
-                mentions.append(first_last_initial)
+        Each variation is searched for on its own: they can overlap in the text
+        (e.g. "juan o" and "ortiz" in "juan ortiz"), so a single alternation would
+        hide some of them.
+        """
+        text_lower = text.lower()
+        mentions = [mention for mention, variant in self.player_name_variants(player_name)
+                    if variant in text_lower]
         
         return len(mentions) > 0, mentions
     
-    def analyze_sentiment(self, text: str, player_name: str) -> Tuple[float, str]:
+    def analyze_sentiment(self, text: str, player_name: str, word_count: Optional[int] = None) -> Tuple[float, str]:
         """Analyze sentiment of article regarding the player"""
         text_lower = text.lower()
+        if word_count is None:
+            word_count = len(text.split())
         
         positive_count = sum(1 for word in self.sports_keywords['positive'] if word in text_lower)
         negative_count = sum(1 for word in self.negative_indicators if word in text_lower)
         
         if positive_count > negative_count:
-            sentiment_score = min((positive_count - negative_count) / max(len(text.split()), 1) * 100, 1.0)
+            sentiment_score = min((positive_count - negative_count) / max(word_count, 1) * 100, 1.0)
             sentiment_label = "positive"
         elif negative_count > positive_count:
-            sentiment_score = -min((negative_count - positive_count) / max(len(text.split()), 1) * 100, 1.0)
+            sentiment_score = -min((negative_count - positive_count) / max(word_count, 1) * 100, 1.0)
             sentiment_label = "negative"
         else:
             sentiment_score = 0.0
@@ -1600,7 +1787,8 @@ class ContentAnalyzer:
     
     def is_relevant_article(self, text: str, player_name: str, min_words: int = 20) -> Tuple[bool, Dict]:
         """Comprehensive relevance check"""
-        if len(text.split()) < min_words:
+        word_count = len(text.split())
+        if word_count < min_words:
             return False, {"reason": "Too short"}
         
         is_sports, sports_score, sport_keywords = self.analyze_sports_relevance(text)
@@ -1611,7 +1799,7 @@ class ContentAnalyzer:
         if not has_player:
             return False, {"reason": "Player not mentioned", "sports_score": sports_score}
         
-        sentiment_score, sentiment_label = self.analyze_sentiment(text, player_name)
+        sentiment_score, sentiment_label = self.analyze_sentiment(text, player_name, word_count=word_count)
         
         analysis = {
             "sports_score": sports_score,
@@ -1619,7 +1807,7 @@ class ContentAnalyzer:
             "player_mentions": mentions,
             "sentiment_score": sentiment_score,
             "sentiment_label": sentiment_label,
-            "word_count": len(text.split())
+            "word_count": word_count
         }
         
         is_relevant = sentiment_score >= -0.1
@@ -1699,6 +1887,15 @@ class NewspapersComExtractor:
             logger.error(f"Error syncing cookies to persistent storage: {str(e)}")
             return False
     
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _date_param(date_range: Optional[str]) -> Dict:
+        """Translate a 'YYYY-YYYY' range into the search dr_year param (cached; treat as read-only)"""
+        if date_range and date_range != "Any" and '-' in date_range:
+            start_year, end_year = date_range.split('-')
+            return {'dr_year': f"{start_year}-01-01|{end_year}-12-31"}
+        return {}
+    
     def search_articles(self, query: str, date_range: Optional[str] = None, limit: int = 20) -> List[Dict]:
         logger.info(f"Starting search for query: '{query}'")
         logger.info(f"Date range: {date_range}")
@@ -1714,34 +1911,21 @@ class NewspapersComExtractor:
             
             params = {
                 'query': query,
-                'sort': 'relevance'
+                'sort': 'relevance',
+                **self._date_param(date_range)
             }
             
-            if date_range and date_range != "Any":
-                if '-' in date_range:
-                    start_year, end_year = date_range.split('-')
-                    params['dr_year'] = f"{start_year}-01-01|{end_year}-12-31"
-                    logger.info(f"Applied date filter: {params['dr_year']}")
+            if 'dr_year' in params:
+                logger.info(f"Applied date filter: {params['dr_year']}")
             
             logger.info(f"Search URL: {search_url}")
             logger.info(f"Search parameters: {params}")
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Referer': 'https://www.newspapers.com/',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            }
-            
             logger.info("Sending search request...")
             response = self.cookie_manager.session.get(
                 search_url, 
                 params=params,
-                headers=headers,
+                headers=_SEARCH_HEADERS,
                 timeout=30
             )
             
@@ -1764,7 +1948,7 @@ class NewspapersComExtractor:
         logger.info("Parsing search results from HTML...")
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, HTML_PARSER)
             
             articles = []
             
@@ -1831,16 +2015,15 @@ class NewspapersComExtractor:
     
     def _extract_article_from_element(self, element, index: int) -> Optional[Dict]:
         try:
-            title_selectors = ['h3', '.title', '.headline', 'a']
             title = "Unknown Title"
-            for selector in title_selectors:
-                title_elem = element.select_one(selector)
+            for selector in _RESULT_TITLE_SELECTORS:
+                title_elem = selector.select_one(element)
                 if title_elem:
                     title = title_elem.get_text(strip=True)
                     break
             
             url = ""
-            link_elem = element.select_one('a[href]')
+            link_elem = _RESULT_LINK_SELECTOR.select_one(element)
             if link_elem:
                 href = link_elem.get('href')
                 if href.startswith('/'):
@@ -1848,26 +2031,23 @@ class NewspapersComExtractor:
                 else:
                     url = href
             
-            date_selectors = ['.date', '.published', '[data-date]']
             date = "Unknown"
-            for selector in date_selectors:
-                date_elem = element.select_one(selector)
+            for selector in _RESULT_DATE_SELECTORS:
+                date_elem = selector.select_one(element)
                 if date_elem:
                     date = date_elem.get_text(strip=True)
                     break
             
-            newspaper_selectors = ['.newspaper', '.source', '.publication']
             newspaper = "Unknown"
-            for selector in newspaper_selectors:
-                news_elem = element.select_one(selector)
+            for selector in _RESULT_NEWSPAPER_SELECTORS:
+                news_elem = selector.select_one(element)
                 if news_elem:
                     newspaper = news_elem.get_text(strip=True)
                     break
             
-            preview_selectors = ['.preview', '.snippet', '.excerpt', 'p']
             preview = title
-            for selector in preview_selectors:
-                preview_elem = element.select_one(selector)
+            for selector in _RESULT_PREVIEW_SELECTORS:
+                preview_elem = selector.select_one(element)
                 if preview_elem:
                     preview_text = preview_elem.get_text(strip=True)
                     if len(preview_text) > 20:
@@ -2008,38 +2188,38 @@ class NewspapersComExtractor:
                     raise
             
             try:
-                # Add cookies for authentication
-                driver.get("https://www.newspapers.com")
-                
-                # Wait for initial page load (reduced timeout)
-                WebDriverWait(driver, 30).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-                
-                # Add cookies after initial page load (batch operation)
-                cookies_to_add = [
-                    {'name': name, 'value': value, 'domain': '.newspapers.com', 'path': '/'}
-                    for name, value in self.cookie_manager.cookies.items()
-                ]
-                
-                for cookie_dict in cookies_to_add:
-                    try:
-                        driver.add_cookie(cookie_dict)
-                    except Exception as e:
-                        logger.warning(f"Could not add cookie {cookie_dict['name']} to wire driver: {e}")
+                # Add cookies for authentication in one CDP call; that needs no page loaded,
+                # so the home page visit is only required for the add_cookie fallback
+                if not _set_cookies_via_cdp(driver, self.cookie_manager.cookies):
+                    driver.get("https://www.newspapers.com")
+                    
+                    # Wait for initial page load (reduced timeout)
+                    WebDriverWait(driver, 30).until(
+                        EC.presence_of_element_located((By.TAG_NAME, "body"))
+                    )
+                    
+                    # Add cookies after initial page load
+                    cookies_to_add = [
+                        {'name': name, 'value': value, 'domain': '.newspapers.com', 'path': '/'}
+                        for name, value in self.cookie_manager.cookies.items()
+                    ]
+                    
+                    for cookie_dict in cookies_to_add:
+                        try:
+                            driver.add_cookie(cookie_dict)
+                        except Exception as e:
+                            logger.warning(f"Could not add cookie {cookie_dict['name']} to wire driver: {e}")
                 
                 # Navigate to the target URL
                 logger.info(f"Navigating to URL: {url}")
                 driver.get(url)
                 
                 # Wait for download button to appear (reduced timeout)
+                # Each click below does its own explicit clickable wait, so no fixed settle sleep
                 WebDriverWait(driver, 45).until(
                     EC.element_to_be_clickable((By.ID, "btn-print"))
                 )
                 
-                # Minimal wait for UI to stabilize
-                time.sleep(2)
-                
                 # Configure selectors for the 2-click path (no third click needed)
                 CLICK_SELECTORS = [
                     # First click - open download menu
@@ -3,6 +3,7 @@
 # Focus: Zoom out → Screenshot → Crop → Save
 
 import os
+import atexit
 import time
 import logging
 from selenium import webdriver
@@ -13,32 +14,166 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from PIL import Image
 import io
-from typing import Optional, Tuple
-from datetime import datetime
-from urllib.parse import urlparse
+import binascii
+import hashlib
+import struct
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import List, Literal, Optional, Tuple
+from urllib.parse import urlsplit
 
 logger = logging.getLogger(__name__)
 
+# Process-wide Chrome shared by extractors created with use_global=True. _GLOBAL_LOCK
+# guards creating/quitting it; _GLOBAL_USE_LOCK is held for a whole extraction so
+# concurrent callers never interleave navigation on the one browser.
+_GLOBAL_DRIVER: Optional[webdriver.Chrome] = None
+_GLOBAL_LOCK = threading.Lock()
+_GLOBAL_USE_LOCK = threading.Lock()
+
+
+def _quit_global_driver():
+    """Quit the shared Chrome driver at interpreter exit"""
+    global _GLOBAL_DRIVER
+    with _GLOBAL_LOCK:
+        if _GLOBAL_DRIVER is not None:
+            try:
+                _GLOBAL_DRIVER.quit()
+            except Exception as e:
+                logger.warning("Global driver cleanup failed: %s", e)
+            _GLOBAL_DRIVER = None
+
+
+atexit.register(_quit_global_driver)
+
+# Margins trimmed from the viewport when capturing: site header on top, padding elsewhere
+CROP_TOP = 100
+CROP_SIDE = 50
+CROP_BOTTOM = 50
+
+# Article viewer content; present once the clipping itself has rendered
+ARTICLE_SELECTOR = "#viewer canvas, .clippings_viewer canvas, img[alt*='page' i]"
+
+# Error and not-found page containers; pages showing one will never render an article
+NO_ARTICLE_SELECTOR = ".error-page, #error-page, .not-found, .page-not-found"
+
+# Viewport size plus the page-relative box of the largest matching article element,
+# in one round-trip (the first match in document order could be a small stray canvas)
+_ARTICLE_RECT_JS = """
+var rect = null, best = 0;
+document.querySelectorAll(arguments[0]).forEach(function (el) {
+    var r = el.getBoundingClientRect();
+    if (r.width * r.height > best) {
+        best = r.width * r.height;
+        rect = [r.left + window.scrollX, r.top + window.scrollY, r.width, r.height];
+    }
+});
+return [window.innerWidth, window.innerHeight, rect];
+"""
+
+# Smallest article box worth clipping to; anything smaller is likely a placeholder
+MIN_ARTICLE_BOX = 200
+
+# Third-party requests that never show up in the clipping region
+BLOCKED_URL_PATTERNS = [
+    '*doubleclick.net*', '*googlesyndication.com*', '*google-analytics.com*',
+    '*googletagmanager.com*', '*hotjar.com*', '*segment.io*', '*facebook.net*',
+    '*.woff2', '*.woff',
+]
+
+
+@dataclass
+class Screenshot:
+    """Encoded image bytes captured from Chrome, with their pixel dimensions"""
+    data: bytes
+    width: int
+    height: int
+    format: str = 'png'
+    
+    @classmethod
+    def from_png(cls, data: bytes) -> 'Screenshot':
+        # IHDR is always the first chunk: 8-byte signature, length, type, then width/height
+        width, height = struct.unpack('>II', data[16:24])
+        return cls(data, width, height)
+    
+    def to_image(self, target_size: Optional[Tuple[int, int]] = None) -> Image.Image:
+        """Open the capture as a PIL image (pixels are only decoded when first accessed).
+        
+        With target_size the image is shrunk to fit it; draft() lets JPEG captures
+        downscale during decoding instead of decoding at full size first.
+        """
+        image = Image.open(io.BytesIO(self.data))
+        if target_size and (self.width > target_size[0] or self.height > target_size[1]):
+            image.draft('RGB', target_size)
+            image.thumbnail(target_size, Image.LANCZOS, reducing_gap=2.0)
+        return image
+
 class OptimizedNewspapersExtractor:
     """Optimized newspapers.com extractor focusing only on screenshot and crop functionality"""
     
-    def __init__(self, cookies: str = ""):
+    SOURCE = 'newspapers.com'
+    
+    def __init__(self, cookies: str = "", return_format: Literal["pil", "bytes", "path"] = "pil",
+                 output_dir: str = "extracted_images", max_image_size: Optional[Tuple[int, int]] = None,
+                 screenshot_format: Literal["png", "jpeg", "webp"] = "png", screenshot_quality: int = 85,
+                 use_global: bool = False):
+        """
+        Args:
+            cookies: Cookie string for authentication
+            return_format: How 'image_data' is returned - a PIL image, the encoded
+                bytes as captured by Chrome, or the path of the file written to
+                output_dir. The last two never decode or re-encode the capture; the
+                result's 'image_format' says which encoding (screenshot_format) it is.
+            output_dir: Directory for image files when return_format is "path"
+            max_image_size: Optional (width, height) bound for the "pil" image
+            screenshot_format: Encoding Chrome uses for the capture; jpeg/webp are
+                lossy but much smaller, png is encoded with optimizeForSpeed
+            screenshot_quality: Quality for jpeg/webp captures
+            use_global: Share one process-wide Chrome driver, kept alive until exit;
+                extractions using it are serialized
+        """
+        if return_format not in ("pil", "bytes", "path"):
+            raise ValueError(f"Unsupported return_format: {return_format}")
+        if screenshot_format not in ("png", "jpeg", "webp"):
+            raise ValueError(f"Unsupported screenshot_format: {screenshot_format}")
         self.driver = None
         self.cookies = self._parse_cookies(cookies) if cookies else {}
+        self.return_format = return_format
+        self.output_dir = output_dir
+        self.max_image_size = max_image_size
+        self.screenshot_format = screenshot_format
+        self.screenshot_quality = screenshot_quality
+        self.use_global = use_global
         self.is_replit = 'REPL_ID' in os.environ or 'REPL_SLUG' in os.environ
         
     def _parse_cookies(self, cookie_string: str) -> dict:
         """Parse cookie string into dictionary"""
-        cookies = {}
-        if cookie_string:
-            for cookie in cookie_string.split(';'):
-                if '=' in cookie:
-                    name, value = cookie.strip().split('=', 1)
-                    cookies[name] = value
-        return cookies
+        return {
+            name.strip(): value.strip()
+            for part in cookie_string.split(';') if '=' in part
+            for name, value in [part.split('=', 1)]
+            if name.strip()
+        }
     
     def _initialize_chrome_driver(self) -> bool:
-        """Initialize Chrome driver with minimal configuration"""
+        """Initialize Chrome driver, reusing the process-wide one when use_global is set"""
+        if not self.use_global:
+            return self._create_chrome_driver()
+        
+        global _GLOBAL_DRIVER
+        with _GLOBAL_LOCK:
+            if _GLOBAL_DRIVER is None:
+                if not self._create_chrome_driver():
+                    return False
+                _GLOBAL_DRIVER = self.driver
+            else:
+                self.driver = _GLOBAL_DRIVER
+        return True
+    
+    def _create_chrome_driver(self) -> bool:
+        """Create a Chrome driver with minimal configuration"""
         try:
             chrome_options = Options()
             chrome_options.add_argument('--headless=new')
@@ -48,95 +183,187 @@ class OptimizedNewspapersExtractor:
             chrome_options.add_argument('--window-size=1920,1080')
             chrome_options.add_argument('--disable-extensions')
             chrome_options.add_argument('--disable-popup-blocking')
+            # Skip browser subsystems a headless scrape never uses
+            chrome_options.add_argument('--disable-background-networking')
+            chrome_options.add_argument('--disable-default-apps')
+            chrome_options.add_argument('--disable-sync')
+            chrome_options.add_argument('--disable-translate')
+            chrome_options.add_argument('--mute-audio')
+            chrome_options.add_argument('--no-first-run')
+            chrome_options.add_argument('--disable-client-side-phishing-detection')
+            chrome_options.add_argument('--disable-component-update')
+            chrome_options.add_argument('--disable-domain-reliability')
+            chrome_options.add_argument('--metrics-recording-only')
+            # Return from get() at DOMContentLoaded instead of waiting on every ad/tracker
+            chrome_options.page_load_strategy = 'eager'
+            
+            # Chrome only honours the last --disable-features flag, so collect them here
+            disabled_features = ['AudioServiceOutOfProcess']
             
             # Replit-specific optimizations
             if self.is_replit:
-                chrome_options.add_argument('--single-process')
-                chrome_options.add_argument('--disable-features=VizDisplayCompositor')
+                # Fewer renderer processes without --single-process, which hangs on renderer crashes
+                disabled_features += ['VizDisplayCompositor', 'IsolateOrigins', 'site-per-process']
                 chrome_options.add_argument('--disable-background-timer-throttling')
-                chrome_options.add_argument('--renderer-timeout=30000')
                 logger.info("Applied Replit optimizations")
+            chrome_options.add_argument(f"--disable-features={','.join(disabled_features)}")
             
             self.driver = webdriver.Chrome(options=chrome_options)
+            self._block_third_party_requests()
             
             # Set timeouts
-            timeout = 120 if self.is_replit else 30
-            self.driver.set_page_load_timeout(timeout)
-            self.driver.implicitly_wait(20 if self.is_replit else 10)
+            self.driver.set_page_load_timeout(30)
             
             return True
             
         except WebDriverException as e:
-            logger.error(f"Failed to initialize Chrome driver: {str(e)}")
+            logger.error("Failed to initialize Chrome driver: %s", e)
             return False
     
+    def _block_third_party_requests(self):
+        """Block ads, analytics and web fonts at the network layer via CDP"""
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning("Could not set blocked URLs: %s", e)
+    
     def _apply_cookies(self):
-        """Apply cookies to the driver"""
+        """Apply cookies to the driver before the first navigation"""
         if not self.cookies:
             return
-            
-        self.driver.get('https://www.newspapers.com/')
         
-        for name, value in self.cookies.items():
+        cookie_list = [
+            {'name': name, 'value': value, 'domain': '.newspapers.com', 'path': '/'}
+            for name, value in self.cookies.items()
+        ]
+        
+        # One CDP call sets every cookie without having to be on the domain first
+        try:
+            self.driver.execute_cdp_cmd('Network.setCookies', {'cookies': cookie_list})
+            logger.info("Set %d cookies via CDP", len(cookie_list))
+            return
+        except Exception as e:
+            logger.warning("CDP cookie setup failed, falling back to add_cookie: %s", e)
+        
+        # add_cookie only works on a page of the cookie's domain; robots.txt is the
+        # lightest one, and the cookies go out with the article request itself
+        self.driver.get('https://www.newspapers.com/robots.txt')
+        
+        for cookie in cookie_list:
             try:
-                self.driver.add_cookie({
-                    'name': name,
-                    'value': value,
-                    'domain': '.newspapers.com',
-                    'path': '/'
-                })
+                self.driver.add_cookie(cookie)
             except Exception as e:
-                logger.warning(f"Could not add cookie {name}: {e}")
+                logger.warning("Could not add cookie %s: %s", cookie['name'], e)
+    
+    def _wait_for_page_ready(self, timeout: int = 30, load_event_timeout: float = 5.0):
+        """Wait for the DOM, then give the load event a short bounded window (instead of fixed sleeps).
         
-        # Refresh to apply cookies
-        self.driver.refresh()
-        time.sleep(2)
+        The driver uses the 'eager' load strategy, so third-party sub-resources can keep
+        loading after this returns; the article image itself is first-party.
+        """
+        WebDriverWait(self.driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") in ("interactive", "complete")
+        )
+        try:
+            WebDriverWait(self.driver, load_event_timeout, poll_frequency=0.1).until(
+                lambda d: d.execute_script(
+                    "return performance.timing.loadEventEnd - performance.timing.navigationStart"
+                ) > 0
+            )
+        except TimeoutException:
+            logger.debug("Load event did not finish within ceiling; continuing")
     
-    def _zoom_out(self, zoom_clicks: int = 3):
-        """Zoom out to get full article view"""
+    def _wait_for_article(self, timeout: int = 10) -> bool:
+        """Wait until the article viewer content is visible, not just the page body
+        
+        Stops early when an error or not-found container shows up instead.
+        
+        Returns:
+            False if no article is visible and an error/not-found container is
+            present; True otherwise (including on timeout, where the capture goes
+            ahead anyway)
+        """
         try:
-            for i in range(zoom_clicks):
-                self.driver.execute_script("document.body.style.zoom='0.7'")
-                time.sleep(1)
-            logger.info(f"Applied {zoom_clicks} zoom out operations")
-        except Exception as e:
-            logger.warning(f"Zoom out failed: {e}")
+            WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(EC.any_of(
+                EC.visibility_of_element_located((By.CSS_SELECTOR, ARTICLE_SELECTOR)),
+                EC.presence_of_element_located((By.CSS_SELECTOR, NO_ARTICLE_SELECTOR))
+            ))
+        except TimeoutException:
+            logger.warning("Article viewer not visible before timeout; capturing anyway")
+            return True
+        
+        # A visible article wins over any marker elsewhere on the page
+        if any(el.is_displayed() for el in self.driver.find_elements(By.CSS_SELECTOR, ARTICLE_SELECTOR)):
+            return True
+        if self.driver.find_elements(By.CSS_SELECTOR, NO_ARTICLE_SELECTOR):
+            logger.warning("Page shows an error or not-found container instead of an article")
+            return False
+        return True
     
-    def _capture_screenshot(self) -> Optional[Image.Image]:
-        """Capture screenshot of the current page"""
+    def _zoom_out(self, zoom: float = 0.7):
+        """Zoom out to get full article view.
+        
+        The zoom is set once and the script resolves after the next painted frame,
+        so the screenshot sees the re-laid-out page without a fixed sleep.
+        """
         try:
-            screenshot_data = self.driver.get_screenshot_as_png()
-            image = Image.open(io.BytesIO(screenshot_data))
-            logger.info(f"Captured screenshot: {image.size}")
-            return image
+            self.driver.execute_async_script(
+                "var done = arguments[arguments.length - 1];"
+                "document.body.style.zoom = arguments[0];"
+                "requestAnimationFrame(function () { requestAnimationFrame(function () { done(); }); });",
+                str(zoom)
+            )
+            logger.info("Applied zoom %s", zoom)
         except Exception as e:
-            logger.error(f"Screenshot capture failed: {e}")
-            return None
+            logger.warning("Zoom out failed: %s", e)
     
-    def _crop_newspaper_clipping(self, image: Image.Image) -> Optional[Image.Image]:
-        """Basic cropping to remove browser chrome and focus on content"""
+    def _capture_screenshot(self) -> Optional[Tuple[Screenshot, Tuple[int, int]]]:
+        """Capture the clipping region of the current viewport.
+        
+        The crop is done by Chrome via a CDP clip rectangle, so only the wanted pixels
+        are encoded and sent back. The clip is the article element's box when it can be
+        located, otherwise the viewport minus the fixed margins. The image is not decoded here.
+        Returns (screenshot, (viewport_width, viewport_height)).
+        """
         try:
-            width, height = image.size
+            width, height, article_rect = self.driver.execute_script(_ARTICLE_RECT_JS, ARTICLE_SELECTOR)
+            clip_width = width - 2 * CROP_SIDE
+            clip_height = height - CROP_TOP - CROP_BOTTOM
             
-            # Simple crop - remove top browser chrome (approximately 100px)
-            # and some padding from sides
-            crop_top = 100
-            crop_left = 50
-            crop_right = width - 50
-            crop_bottom = height - 50
+            if article_rect and article_rect[2] >= MIN_ARTICLE_BOX and article_rect[3] >= MIN_ARTICLE_BOX:
+                x, y, box_width, box_height = article_rect
+                clip = {'x': x, 'y': y, 'width': box_width, 'height': box_height, 'scale': 1}
+            elif clip_width > 0 and clip_height > 0:
+                clip = {'x': CROP_SIDE, 'y': CROP_TOP, 'width': clip_width, 'height': clip_height, 'scale': 1}
+            else:
+                logger.warning("Invalid crop dimensions, capturing full viewport")
+                clip = {'x': 0, 'y': 0, 'width': width, 'height': height, 'scale': 1}
+            
+            params = {
+                'format': self.screenshot_format,
+                'clip': clip,
+                'captureBeyondViewport': True
+            }
+            if self.screenshot_format == 'png':
+                params['optimizeForSpeed'] = True
+            else:
+                params['quality'] = self.screenshot_quality
             
-            # Ensure crop dimensions are valid
-            if crop_right > crop_left and crop_bottom > crop_top:
-                cropped = image.crop((crop_left, crop_top, crop_right, crop_bottom))
-                logger.info(f"Cropped image: {image.size} → {cropped.size}")
-                return cropped
+            # Decode straight from the CDP string and drop the base64 text right away,
+            # so only one copy of the capture is alive per worker at a time
+            data = binascii.a2b_base64(
+                self.driver.execute_cdp_cmd('Page.captureScreenshot', params).pop('data')
+            )
+            if self.screenshot_format == 'png':
+                screenshot = Screenshot.from_png(data)
             else:
-                logger.warning("Invalid crop dimensions, returning original image")
-                return image
-                
+                screenshot = Screenshot(data, int(clip['width']), int(clip['height']), self.screenshot_format)
+            logger.info("Captured clipped screenshot: %dx%d → %dx%d", width, height, screenshot.width, screenshot.height)
+            return screenshot, (width, height)
         except Exception as e:
-            logger.error(f"Cropping failed: {e}")
-            return image
+            logger.error("Screenshot capture failed: %s", e)
+            return None
     
     def extract_from_url(self, url: str) -> dict:
         """
@@ -148,61 +375,148 @@ class OptimizedNewspapersExtractor:
         Returns:
             Dictionary with extraction result
         """
+        try:
+            return self._extract_once(url)
+        finally:
+            self._cleanup(close=True)
+    
+    def extract_many(self, urls: List[str], max_concurrency: int = 4) -> List[dict]:
+        """
+        Extract screenshots from several newspapers.com URLs
+        
+        Each worker thread owns its own extractor and Chrome driver, started
+        once and reused for every URL that worker picks up. With
+        max_concurrency=1 this instance's own driver is reused serially.
+        
+        Args:
+            urls: Newspapers.com URLs to extract from
+            max_concurrency: Maximum number of Chrome instances running at once
+            
+        Returns:
+            List of extraction result dictionaries, in the same order as urls
+        """
+        if max_concurrency <= 1 or len(urls) <= 1:
+            try:
+                return [self._extract_once(url) for url in urls]
+            finally:
+                self._cleanup(close=True)
+        
+        # Each Chrome is ~300 MB, so cap how many run simultaneously
+        browser_slots = threading.Semaphore(max_concurrency)
+        worker_state = threading.local()
+        workers = []
+        workers_lock = threading.Lock()
+        
+        def _worker_extractor() -> 'OptimizedNewspapersExtractor':
+            extractor = getattr(worker_state, 'extractor', None)
+            if extractor is None:
+                extractor = OptimizedNewspapersExtractor(return_format=self.return_format,
+                                                         output_dir=self.output_dir,
+                                                         max_image_size=self.max_image_size,
+                                                         screenshot_format=self.screenshot_format,
+                                                         screenshot_quality=self.screenshot_quality)
+                extractor.cookies = self.cookies
+                worker_state.extractor = extractor
+                with workers_lock:
+                    workers.append(extractor)
+            return extractor
+        
+        def _run(url: str) -> dict:
+            with browser_slots:
+                return _worker_extractor()._extract_once(url)
+        
+        results = [None] * len(urls)
+        try:
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                futures = {executor.submit(_run, url): index for index, url in enumerate(urls)}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+        finally:
+            for extractor in workers:
+                extractor._cleanup(close=True)
+        
+        if logger.isEnabledFor(logging.INFO):
+            succeeded = sum(1 for r in results if r and r.get('success'))
+            logger.info("Batch extraction finished: %d/%d succeeded", succeeded, len(urls))
+        return results
+    
+    def _ensure_driver(self) -> bool:
+        """Start the Chrome driver and apply cookies if not already running"""
+        if self.driver is not None:
+            return True
+        
+        if not self._initialize_chrome_driver():
+            return False
+        
+        # Apply cookies for authentication
+        self._apply_cookies()
+        return True
+    
+    def _extract_once(self, url: str) -> dict:
+        """Navigate the (possibly reused) driver to url and capture the clipping
+        
+        With use_global the shared driver is held exclusively for the whole
+        extraction, so concurrent callers take turns on it.
+        """
+        with _GLOBAL_USE_LOCK if self.use_global else nullcontext():
+            return self._navigate_and_capture(url)
+    
+    def _navigate_and_capture(self, url: str) -> dict:
+        """Load url in this extractor's driver and capture the clipping"""
         start_time = time.time()
         
         try:
             # Initialize driver
-            if not self._initialize_chrome_driver():
+            if not self._ensure_driver():
                 return {
                     'success': False,
                     'error': 'Failed to initialize Chrome driver',
                     'processing_time_seconds': time.time() - start_time
                 }
             
-            # Apply cookies for authentication
-            self._apply_cookies()
-            
             # Navigate to the URL
-            logger.info(f"Navigating to: {url}")
+            logger.info("Navigating to: %s", url)
             self.driver.get(url)
             
-            # Wait for page to load
-            WebDriverWait(self.driver, 30).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            time.sleep(3)  # Additional wait for content to render
+            # Wait for page to load and the article itself to render
+            self._wait_for_page_ready()
+            if not self._wait_for_article():
+                return {
+                    'success': False,
+                    'error': 'No article found on page',
+                    'processing_time_seconds': time.time() - start_time
+                }
             
             # Zoom out for better article view
             self._zoom_out()
             
-            # Capture screenshot
-            screenshot = self._capture_screenshot()
-            if not screenshot:
+            # Capture screenshot (already cropped to the clipping region)
+            capture = self._capture_screenshot()
+            if not capture:
                 return {
                     'success': False,
                     'error': 'Failed to capture screenshot',
                     'processing_time_seconds': time.time() - start_time
                 }
-            
-            # Crop the image
-            cropped_image = self._crop_newspaper_clipping(screenshot)
+            screenshot, (viewport_width, viewport_height) = capture
             
             # Extract basic metadata from URL
-            parsed_url = urlparse(url)
-            title = f"Newspaper Clipping from {parsed_url.netloc}"
+            title = f"Newspaper Clipping from {urlsplit(url).netloc}"
             
             return {
                 'success': True,
-                'image_data': cropped_image,
+                'image_data': self._format_image(screenshot, url),
+                'image_bytes': screenshot.data,
+                'image_format': screenshot.format,
                 'headline': title,
-                'source': 'newspapers.com',
-                'date': datetime.now().strftime('%Y-%m-%d'),
+                'source': self.SOURCE,
+                'date': time.strftime('%Y-%m-%d'),
                 'url': url,
                 'processing_time_seconds': time.time() - start_time,
                 'metadata': {
                     'extraction_method': 'optimized_screenshot',
-                    'image_size': f"{cropped_image.width}x{cropped_image.height}",
-                    'original_size': f"{screenshot.width}x{screenshot.height}"
+                    'image_size': f"{screenshot.width}x{screenshot.height}",
+                    'original_size': f"{viewport_width}x{viewport_height}"
                 }
             }
             
@@ -213,24 +527,43 @@ class OptimizedNewspapersExtractor:
                 'processing_time_seconds': time.time() - start_time
             }
         except Exception as e:
-            logger.error(f"Extraction failed: {str(e)}")
+            logger.error("Extraction failed: %s", e)
             return {
                 'success': False,
                 'error': f'Extraction error: {str(e)}',
                 'processing_time_seconds': time.time() - start_time
             }
-        finally:
-            self._cleanup()
     
-    def _cleanup(self):
-        """Cleanup driver resources"""
+    def _format_image(self, screenshot: Screenshot, url: str):
+        """Convert the captured image to the configured return_format"""
+        if self.return_format == "bytes":
+            return screenshot.data
+        if self.return_format == "path":
+            os.makedirs(self.output_dir, exist_ok=True)
+            url_hash = hashlib.blake2b(url.encode('utf-8'), digest_size=6).hexdigest()
+            extension = 'jpg' if screenshot.format == 'jpeg' else screenshot.format
+            path = os.path.join(self.output_dir, f"newspapers_{url_hash}.{extension}")
+            with open(path, 'wb') as f:
+                f.write(screenshot.data)
+            logger.info("Wrote clipping image to %s", path)
+            return path
+        return screenshot.to_image(self.max_image_size)
+    
+    def _cleanup(self, close: bool = False):
+        """Cleanup driver resources; a no-op unless close is set so the driver can be reused"""
+        if not close:
+            return
+        if self.use_global:
+            # The shared driver is quit at exit; just detach from it
+            self.driver = None
+            return
         if self.driver:
             try:
                 self.driver.quit()
                 self.driver = None
                 logger.info("Driver cleanup completed")
             except Exception as e:
-                logger.warning(f"Driver cleanup failed: {e}")
+                logger.warning("Driver cleanup failed: %s", e)
 
 # Legacy function for compatibility
 def extract_from_newspapers_com(url: str, cookies: str = "", **kwargs) -> dict:
@@ -240,12 +573,12 @@ def extract_from_newspapers_com(url: str, cookies: str = "", **kwargs) -> dict:
     Args:
         url: Newspapers.com URL
         cookies: Cookie string for authentication
-        **kwargs: Additional arguments (ignored for optimization)
+        **kwargs: Additional arguments; only use_global is honoured
         
     Returns:
         Extraction result dictionary
     """
-    extractor = OptimizedNewspapersExtractor(cookies=cookies)
+    extractor = OptimizedNewspapersExtractor(cookies=cookies, use_global=kwargs.get('use_global', False))
     return extractor.extract_from_url(url)
 
 # Main function for testing
@@ -253,7 +586,7 @@ def main():
     """Test the optimized extractor"""
     test_url = "https://www.newspapers.com/article/example"
     
-    extractor = OptimizedNewspapersExtractor()
+    extractor = OptimizedNewspapersExtractor(use_global=True)
     result = extractor.extract_from_url(test_url)
     
     if result['success']:
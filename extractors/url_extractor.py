@@ -1,6 +1,9 @@
 # Enhanced Dynamic Newspaper Article Generator
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import soupsieve
 import re
 import logging
 from utils.logger import setup_logging
@@ -8,15 +11,28 @@ import time
 from urllib.parse import urlparse
 from PIL import Image, ImageDraw, ImageFont
 import io
-import textwrap
+import threading
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from array import array
 import os
+import shutil
 from datetime import datetime
-import math
 from enum import Enum
+from functools import lru_cache
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 from utils.storage_manager import StorageManager
 from utils.paragraph_formatter import format_article_paragraphs
+from utils.html_parser import HTML_PARSER
+
+# Optional numpy for summing word widths across long paragraphs
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 # Import capsule parser for typography specifications
 try:
@@ -29,6 +45,199 @@ except ImportError as e:
 # Setup logging
 logger = setup_logging(__name__)
 
+# Article pages are read up to this many (decoded) bytes; the metadata and body come first
+MAX_PAGE_BYTES = 2_000_000
+
+# Patterns used on every extraction, compiled once
+_DATE_RE = re.compile(r'\w+\s+\d+,\s+\d{4}')
+_BYLINE_PREFIX_RE = re.compile(r'^By\s+', re.IGNORECASE)
+_AD_RE = re.compile(r'advertisement|subscribe|privacy policy|cookie policy|terms of use', re.IGNORECASE)
+_NON_IMAGE_URL_RE = re.compile(r'pixel|spacer|tracking|icon|favicon|logo', re.IGNORECASE)
+_SMALL_IMAGE_HINT_RE = re.compile(r'16x16|32x32|48x48|64x64|150x150|thumb|small', re.IGNORECASE)
+_IMAGE_URL_HINT_RE = re.compile(r'\.jpg|\.jpeg|\.png|\.webp|\.gif|image', re.IGNORECASE)
+_FILENAME_UNSAFE_RE = re.compile(r'[^\w\s-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+_META_SELECTOR_RE = re.compile(r'^meta\[(\w+)="([^"]+)"\]$')
+
+
+class _MetaSelector:
+    """Matches one <meta name/property="..."> inside <head> with a plain find() instead of CSS"""
+    
+    def __init__(self, attribute: str, value: str):
+        self.attrs = {attribute: value}
+    
+    def select_one(self, soup):
+        return (soup.head or soup).find('meta', attrs=self.attrs)
+
+
+def _compile_selectors(selectors: List[str]) -> tuple:
+    """Compile CSS selectors once, keeping their priority order and source text"""
+    compiled = []
+    for selector in selectors:
+        meta_match = _META_SELECTOR_RE.match(selector)
+        if meta_match:
+            compiled.append((selector, _MetaSelector(*meta_match.groups())))
+        else:
+            compiled.append((selector, soupsieve.compile(selector)))
+    return tuple(compiled)
+
+
+def _select_first(soup, selectors) -> Tuple[Optional[str], Optional[object]]:
+    """First match of the highest-priority selector that matches, with that selector"""
+    for selector, compiled in selectors:
+        element = compiled.select_one(soup)
+        if element:
+            return selector, element
+    return None, None
+
+
+# Extraction selectors in priority order (earlier selectors win over document order)
+_ESPN_HEADLINE_SELECTORS = _compile_selectors([
+    'header.article-header h1',  # ESPN article headlines - primary selector
+    '.article-header h1',
+    'h1[data-module="Headline"]',  # ESPN article headlines
+    'h1.headline',
+    'article h1',
+    '.story-headline',
+    'h1.ContentHeader__Headline',  # ESPN content header
+    'header h1',
+    'h1'
+])
+_HEADLINE_SELECTORS = _compile_selectors([
+    'h1',
+    'article h1',
+    '.article-header h1',
+    '.article-headline',
+    '.headline',
+    '.story-headline',
+    'header h1'
+])
+_DATE_SELECTORS = _compile_selectors([
+    'span.timestamp',
+    '.article-meta',
+    '.pub-date',
+    '.article-date',
+    'time',
+    '.date',
+    '.published-date',
+    'meta[property="article:published_time"]'
+])
+_ATHLETIC_AUTHOR_SELECTORS = _compile_selectors([
+    '#articleByLineString',  # Athletic byline string ID (stable)
+    'span[id="articleByLineString"]',  # More specific ID selector
+    'span[class*="Article_BylineString"]',  # Partial class match for byline string
+    'span[class*="BylineString"]',  # Even more flexible partial match
+    '[data-testid="author-name"]',  # Athletic specific test ID
+    '.author-name',
+    '.byline-author',
+    '.article-author',
+    'a[href*="/author/"]',  # Author link pattern
+    '.author',
+    '.byline',
+    'meta[name="author"]'
+])
+_AUTHOR_SELECTORS = _compile_selectors([
+    '.author',
+    '.byline',
+    '.author-name',
+    '.article-meta .name',
+    '.writer',
+    'meta[name="author"]',
+    '.contributor',
+    '.contributor__text--name'
+])
+_CONTENT_SELECTORS = _compile_selectors([
+    '.article-body',
+    '#story-body',
+    '.story-content',
+    '[data-article-id]',
+    '.article__content',
+    'article',
+    '.post-content',
+    '.entry-content',
+    '.content'
+])
+_META_IMAGE_SELECTORS = _compile_selectors(['meta[property="og:image"]', 'meta[name="twitter:image"]'])
+_CONTENT_IMAGE_SELECTORS = _compile_selectors(['article img', '.content img', '.story img', 'main img'])
+
+# Content tags rendered as headings in structured content
+_HEADING_TAGS = frozenset(('h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+
+# Shared HTTP session: keep-alive connections are reused across extractions,
+# with request headers that mimic a browser
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+})
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+)
+_SESSION.mount('http://', _HTTP_ADAPTER)
+_SESSION.mount('https://', _HTTP_ADAPTER)
+
+# Encoding for generated clippings: fast PNG by default, 'WEBP' for smaller files
+CLIPPING_FORMAT = 'PNG'
+
+# Articles with less body text than this are not rendered at all
+MIN_CLIPPING_TEXT_LENGTH = 50
+
+# Number of rendered clippings kept for repeat renders of the same article
+CLIPPING_CACHE_SIZE = 16
+
+# Upper bound on memoized text measurements before the cache is reset
+TEXT_WIDTH_CACHE_SIZE = 10000
+
+# Concurrent paragraph-formatter (LLM) calls allowed across extract_from_urls workers
+FORMATTER_MAX_CONCURRENCY = 2
+_FORMATTER_SEMAPHORE = threading.BoundedSemaphore(FORMATTER_MAX_CONCURRENCY)
+
+# Paragraphs at least this long have their word widths summed with numpy when available
+VECTOR_WIDTH_MIN_CHARS = 500
+
+# (family, weight) -> first loadable font name/path, or None when only the default font works
+_FONT_PATH_CACHE = {}
+
+
+@lru_cache(maxsize=128)
+def _load_truetype(font_name: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font once per (name, size) for the whole process"""
+    return ImageFont.truetype(font_name, size)
+
+
+def _resolve_font_path(family: str, weight: str) -> Optional[str]:
+    """Find, once per process, which font file to use for a family and weight"""
+    key = (family, weight)
+    if key in _FONT_PATH_CACHE:
+        return _FONT_PATH_CACHE[key]
+    
+    if weight == 'Bold':
+        fallback = "arial-bold.ttf"
+    elif weight == 'Italic':
+        fallback = "arial-italic.ttf"
+    else:
+        fallback = "arial.ttf"
+    
+    resolved = None
+    for candidate in (f"{family} {weight}", fallback):
+        try:
+            _load_truetype(candidate, 12)
+            resolved = candidate
+            break
+        except OSError:
+            continue
+    
+    _FONT_PATH_CACHE[key] = resolved
+    return resolved
+
 class LayoutType(Enum):
     SINGLE_COLUMN = 1
     TWO_COLUMN = 2
@@ -71,14 +280,83 @@ class NewspaperLayoutEngine:
             'body': {'size_range': (12, 16), 'weight': 'Regular', 'family': 'Georgia'},
             'caption': {'size_range': (10, 12), 'weight': 'Italic', 'family': 'Arial'}
         }
+        
+        # Loaded fonts per layout, so TTF files are only opened once per engine
+        self._font_cache = {}
+        
+        # Text measurement caches keyed by font object (kept alive by the key)
+        self._width_cache = {}
+        self._line_height_cache = {}
+        self._ascii_width_cache = {}
+        
+        # Blank pages with the content-independent decorations already drawn, per layout
+        self._base_canvases = {}
+        
+        # Per-thread page images reused across renders (only the encoded bytes leave the engine)
+        self._image_pool = threading.local()
+        
+        # Rendered clipping bytes keyed by a digest of everything drawn (LRU)
+        self._clipping_cache = OrderedDict()
+        self._clipping_cache_lock = threading.Lock()
+    
+    def _measure(self, font: ImageFont, text: str, draw: ImageDraw) -> int:
+        """Rendered width of text in font, measured once per (font, text)"""
+        key = (font, text)
+        width = self._width_cache.get(key)
+        if width is None:
+            if len(self._width_cache) >= TEXT_WIDTH_CACHE_SIZE:
+                self._width_cache.clear()
+            width = self._width_cache.setdefault(key, draw.textlength(text, font=font))
+        return width
+    
+    def _ascii_widths(self, font: ImageFont, draw: ImageDraw) -> array:
+        """Advance widths of the printable ASCII characters in font, indexed by code point"""
+        table = self._ascii_width_cache.get(font)
+        if table is None:
+            table = array('d', [0.0] * 128)
+            for code in range(32, 127):
+                table[code] = draw.textlength(chr(code), font=font)
+            self._ascii_width_cache[font] = table
+        return table
+    
+    def _word_width(self, font: ImageFont, word: str, draw: ImageDraw, ascii_widths: array) -> float:
+        """Width of a single word: summed from the ASCII table, measured otherwise"""
+        if word.isascii() and word.isprintable():
+            return sum([ascii_widths[ord(char)] for char in word])
+        return self._measure(font, word, draw)
+    
+    def _paragraph_word_widths(self, font: ImageFont, paragraph: str, words: List[str],
+                               draw: ImageDraw, ascii_widths: array) -> List[float]:
+        """Widths of paragraph.split() words in order
+        
+        Long printable-ASCII paragraphs are done in one numpy pass: character widths
+        are looked up from the ASCII table, cumulatively summed, and each word's width
+        is the difference of the sums at its ends. The widths are multiples of 1/64
+        (FreeType advances), so the result matches summing word by word.
+        """
+        if (NUMPY_AVAILABLE and len(paragraph) >= VECTOR_WIDTH_MIN_CHARS
+                and paragraph.isascii() and paragraph.isprintable()):
+            codes = np.frombuffer(paragraph.encode('ascii'), dtype=np.uint8)
+            cumulative = np.concatenate(([0.0], np.cumsum(np.frombuffer(ascii_widths, dtype=np.float64)[codes])))
+            # Word runs start where a space is followed by a non-space and end on the reverse
+            edges = np.flatnonzero(np.diff((codes != 32).astype(np.int8), prepend=0, append=0))
+            return (cumulative[edges[1::2]] - cumulative[edges[0::2]]).tolist()
+        return [self._word_width(font, word, draw, ascii_widths) for word in words]
+    
+    def _line_height(self, font: ImageFont, draw: ImageDraw) -> int:
+        """Height of a body text line in font (without leading)"""
+        height = self._line_height_cache.get(font)
+        if height is None:
+            if len(self._line_height_cache) >= TEXT_WIDTH_CACHE_SIZE:
+                self._line_height_cache.clear()
+            height = self._line_height_cache.setdefault(font, draw.textbbox((0, 0), "Ag", font=font)[3])
+        return height
 
     def determine_layout(self, article_data: dict) -> LayoutType:
         """Intelligently determine the best layout based on article characteristics"""
-        content_length = len(article_data.get('text', ''))
-        headline_length = len(article_data.get('headline', ''))
-        has_image = bool(article_data.get('image_url'))
+        content_length = len(article_data.get('text') or '')
         
-        # Decision logic for layout selection
+        # Decision logic for layout selection: body length alone picks the column count
         if content_length < 500:
             return LayoutType.SINGLE_COLUMN
         elif content_length < 1200:
@@ -88,6 +366,10 @@ class NewspaperLayoutEngine:
     
     def load_fonts(self, layout_type: LayoutType):
         """Load appropriate fonts based on layout size"""
+        cached = self._font_cache.get(layout_type)
+        if cached is not None:
+            return cached
+        
         config = self.layouts[layout_type]
         fonts = {}
         
@@ -97,32 +379,37 @@ class NewspaperLayoutEngine:
         for element, font_config in self.font_configs.items():
             base_size = int(font_config['size_range'][1] * scale_factor)
             
-            try:
-                # Try to load system fonts
-                font_name = f"{font_config['family']} {font_config['weight']}"
-                fonts[element] = ImageFont.truetype(font_name, base_size)
-            except:
-                try:
-                    # Fallback to basic font files
-                    if font_config['weight'] == 'Bold':
-                        fonts[element] = ImageFont.truetype("arial-bold.ttf", base_size)
-                    elif font_config['weight'] == 'Italic':
-                        fonts[element] = ImageFont.truetype("arial-italic.ttf", base_size)
-                    else:
-                        fonts[element] = ImageFont.truetype("arial.ttf", base_size)
-                except:
-                    # Final fallback to default font
-                    fonts[element] = ImageFont.load_default()
+            font_path = _resolve_font_path(font_config['family'], font_config['weight'])
+            if font_path:
+                fonts[element] = _load_truetype(font_path, base_size)
+            else:
+                fonts[element] = ImageFont.load_default()
         
+        self._font_cache[layout_type] = fonts
         return fonts
 
+    def _font_height(self, font: ImageFont, draw: ImageDraw) -> int:
+        """Ascent + descent of font, falling back to a measured line for bitmap fonts"""
+        if hasattr(font, 'getmetrics'):
+            ascent, descent = font.getmetrics()
+            return ascent + descent
+        return self._line_height(font, draw)
+    
     def wrap_text_to_width(self, text: str, font: ImageFont, max_width: int, draw: ImageDraw) -> List[str]:
-        """Advanced text wrapping with proper word breaking"""
+        """Advanced text wrapping with proper word breaking
+        
+        Each unique word is measured once and lines are fitted by adding up word
+        and space widths, so no candidate line is re-measured while it grows. ASCII
+        words are summed from a per-font character width table. Each finished line is
+        measured once to confirm the fit, since summed widths ignore kerning.
+        """
         if not text.strip():
             return []
             
         lines = []
         paragraphs = text.split('\n')
+        space_width = self._measure(font, ' ', draw)
+        ascii_widths = self._ascii_widths(font, draw)
         
         for paragraph in paragraphs:
             if not paragraph.strip():
@@ -130,38 +417,85 @@ class NewspaperLayoutEngine:
                 continue
                 
             words = paragraph.split()
-            current_line = ''
+            widths = {word: self._word_width(font, word, draw, ascii_widths) for word in set(words)}
+            word_count = len(words)
+            start = 0
             
-            for word in words:
-                test_line = f"{current_line} {word}".strip()
-                bbox = draw.textbbox((0, 0), test_line, font=font)
-                line_width = bbox[2] - bbox[0]
+            while start < word_count:
+                end = start + 1
+                line_width = widths[words[start]]
+                while end < word_count and line_width + space_width + widths[words[end]] <= max_width:
+                    line_width += space_width + widths[words[end]]
+                    end += 1
                 
-                if line_width <= max_width:
-                    current_line = test_line
-                else:
-                    if current_line:
-                        lines.append(current_line)
-                        current_line = word
-                    else:
-                        # Handle very long words
-                        lines.append(word)
-                        current_line = ''
-            
-            if current_line:
-                lines.append(current_line)
+                line = ' '.join(words[start:end])
+                while end - start > 1 and draw.textlength(line, font=font) > max_width:
+                    end -= 1
+                    line = ' '.join(words[start:end])
+                
+                lines.append(line)
+                start = end
                 
         return lines
 
+    def break_into_columns(self, text: str, font: ImageFont, column_width: int, column_count: int,
+                           column_height: int, line_height: int, draw: ImageDraw) -> List[List[str]]:
+        """Break body text into lines with an optimal-fit pass, then split them into columns
+        
+        Within each paragraph the breaks minimise the sum of squared leftover space on
+        every line but the last (minimum raggedness), instead of filling lines greedily.
+        Word widths come from the same cached measurements as wrap_text_to_width.
+        """
+        lines = []
+        space_width = self._measure(font, ' ', draw)
+        ascii_widths = self._ascii_widths(font, draw)
+        
+        for paragraph in text.split('\n'):
+            words = paragraph.split()
+            if not words:
+                lines.append('')
+                continue
+            
+            widths = self._paragraph_word_widths(font, paragraph, words, draw, ascii_widths)
+            word_count = len(words)
+            
+            # best_cost[i]: minimal cost of laying out words[i:]; next_break[i]: end of its first line
+            best_cost = [0.0] * (word_count + 1)
+            next_break = [word_count] * (word_count + 1)
+            for start in range(word_count - 1, -1, -1):
+                line_width = widths[start]
+                end = start + 1
+                best = None
+                # A single word always forms a line, even if it is too wide
+                while True:
+                    slack = column_width - line_width
+                    cost = best_cost[end] + (0.0 if end == word_count else slack * slack)
+                    if best is None or cost < best:
+                        best = cost
+                        next_break[start] = end
+                    if end == word_count:
+                        break
+                    line_width += space_width + widths[end]
+                    if line_width > column_width:
+                        break
+                    end += 1
+                best_cost[start] = best
+            
+            start = 0
+            while start < word_count:
+                end = next_break[start]
+                lines.append(' '.join(words[start:end]))
+                start = end
+        
+        return self.distribute_text_across_columns(lines, column_count, column_height, line_height)
+
     def distribute_text_across_columns(self, lines: List[str], column_count: int, 
-                                     column_height: int, font: ImageFont, 
-                                     draw: ImageDraw) -> List[List[str]]:
+                                     column_height: int, line_height: int) -> List[List[str]]:
         """Distribute text lines across multiple columns evenly"""
         if column_count == 1:
             return [lines]
         
         # Calculate how many lines fit in each column
-        line_height = draw.textbbox((0, 0), "Ag", font=font)[3] + 4
         lines_per_column = column_height // line_height
         
         columns = [[] for _ in range(column_count)]
@@ -198,14 +532,13 @@ class NewspaperLayoutEngine:
         
         # Make headline bold and large
         headline_lines = self.wrap_text_to_width(headline, fonts['headline'], max_width, draw)
+        headline_height = self._font_height(fonts['headline'], draw)
         
         for line in headline_lines:
-            bbox = draw.textbbox((0, 0), line, font=fonts['headline'])
-            line_width = bbox[2] - bbox[0]
-            x_center = (config.width - line_width) // 2
+            x_center = int(config.width - self._measure(fonts['headline'], line, draw)) // 2
             
             draw.text((x_center, y_pos), line, fill='black', font=fonts['headline'])
-            y_pos += bbox[3] + 8
+            y_pos += headline_height + 8
         
         y_pos += 10
         
@@ -227,18 +560,14 @@ class NewspaperLayoutEngine:
         date_text = f"{date} | {source}"
         
         # Center the byline
-        bbox = draw.textbbox((0, 0), byline_text, font=fonts['byline'])
-        line_width = bbox[2] - bbox[0]
-        x_center = (config.width - line_width) // 2
+        x_center = int(config.width - self._measure(fonts['byline'], byline_text, draw)) // 2
         draw.text((x_center, y_pos), byline_text, fill='#333333', font=fonts['byline'])
-        y_pos += bbox[3] + 8
+        y_pos += self._font_height(fonts['byline'], draw) + 8
         
         # Center the date
-        bbox = draw.textbbox((0, 0), date_text, font=fonts['date'])
-        line_width = bbox[2] - bbox[0]
-        x_center = (config.width - line_width) // 2
+        x_center = int(config.width - self._measure(fonts['date'], date_text, draw)) // 2
         draw.text((x_center, y_pos), date_text, fill='#666666', font=fonts['date'])
-        y_pos += bbox[3] + 20
+        y_pos += self._font_height(fonts['date'], draw) + 20
         
         # Draw bottom rule under header
         draw.rectangle([
@@ -248,8 +577,8 @@ class NewspaperLayoutEngine:
         
         return y_pos + 25
 
-    def draw_columns(self, draw: ImageDraw, fonts: dict, config: LayoutConfig, 
-                    article_data: dict, start_y: int) -> None:
+    def draw_columns(self, image: Image.Image, draw: ImageDraw, fonts: dict, config: LayoutConfig, 
+                    article_data: dict, start_y: int, line_height: int) -> None:
         """Draw article content in columns with proper newspaper formatting"""
         content = article_data.get('text', '')
         if not content:
@@ -260,41 +589,57 @@ class NewspaperLayoutEngine:
         column_width = (total_width - (config.column_gap * (config.columns - 1))) // config.columns
         column_height = config.height - start_y - config.margin
         
-        # Wrap text to column width
-        content_lines = self.wrap_text_to_width(content, fonts['body'], column_width, draw)
-        
-        # Distribute across columns
-        column_data = self.distribute_text_across_columns(
-            content_lines, config.columns, column_height, fonts['body'], draw
+        # Break text into column-width lines and distribute them across columns
+        column_data = self.break_into_columns(
+            content, fonts['body'], column_width, config.columns, column_height, line_height, draw
         )
         
-        # Draw each column
-        line_height = draw.textbbox((0, 0), "Ag", font=fonts['body'])[3] + 4
+        # Lines that fit above the bottom margin, and the extra spacing that makes
+        # multiline_text (which steps by the height of "A") advance by line_height
+        max_lines = max(0, (config.height - config.margin - start_y) // line_height)
+        spacing = line_height - draw.textbbox((0, 0), "A", font=fonts['body'])[3]
+        separator_bottom = config.height - config.margin + 1
         
+        # Draw each column
         for col_idx, column_lines in enumerate(column_data):
             x_pos = config.margin + col_idx * (column_width + config.column_gap)
-            y_pos = start_y
             
-            # Draw column separator (except for first column)
+            # Draw column separator (except for first column) as a 1px-wide solid fill,
+            # covering the same pixels as a width-1 line down to the bottom margin
             if col_idx > 0:
                 separator_x = x_pos - config.column_gap // 2
-                draw.line([
-                    (separator_x, start_y), 
-                    (separator_x, config.height - config.margin)
-                ], fill='#cccccc', width=1)
-            
-            # Draw text in column
-            for line in column_lines:
-                if y_pos + line_height > config.height - config.margin:
-                    break  # Don't overflow the page
-                    
-                draw.text((x_pos, y_pos), line, fill='black', font=fonts['body'])
-                y_pos += line_height
+                image.paste('#cccccc', (separator_x, start_y, separator_x + 1, separator_bottom))
+            
+            # Draw text in column, clipped so it doesn't overflow the page
+            visible_lines = column_lines[:max_lines]
+            if visible_lines:
+                draw.multiline_text((x_pos, start_y), '\n'.join(visible_lines), fill='black',
+                                    font=fonts['body'], spacing=spacing)
 
     def create_newspaper_clipping(self, article_data: dict) -> Optional[bytes]:
         """Create a dynamic newspaper clipping with appropriate layout"""
         logger.info("Creating enhanced newspaper clipping")
         
+        text = article_data.get('text') or ''
+        if len(text.strip()) < MIN_CLIPPING_TEXT_LENGTH:
+            logger.warning("Article text too short to render a clipping; skipping")
+            return None
+        
+        # Everything the render depends on goes into the cache key
+        digest = hashlib.blake2b(digest_size=16)
+        for field in (CLIPPING_FORMAT, article_data.get('headline'), article_data.get('author'),
+                      article_data.get('date'), article_data.get('source'), text):
+            digest.update(str(field).encode('utf-8', 'surrogatepass'))
+            digest.update(b'\0')
+        cache_key = digest.digest()
+        with self._clipping_cache_lock:
+            cached = self._clipping_cache.get(cache_key)
+            if cached is not None:
+                self._clipping_cache.move_to_end(cache_key)
+        if cached is not None:
+            logger.info("Reusing cached newspaper clipping")
+            return cached
+        
         try:
             # Determine the best layout for this article
             layout_type = self.determine_layout(article_data)
@@ -302,50 +647,106 @@ class NewspaperLayoutEngine:
             
             logger.info(f"Using {layout_type.name} layout ({config.columns} columns)")
             
-            # Create image with calculated dimensions
-            image = Image.new('RGB', (config.width, config.height), '#fafafa')
+            # Start from the layout's pre-drawn page (background, aging effect, corner marks)
+            image = self._page_image(layout_type)
             draw = ImageDraw.Draw(image)
             
             # Load appropriate fonts
             fonts = self.load_fonts(layout_type)
             
-            # Add newspaper aging effect
-            self._add_aging_effect(draw, config)
-            
             # Draw the header section
             content_start_y = self.draw_newspaper_header(draw, fonts, config, article_data)
             
             # Draw the main content in columns
-            self.draw_columns(draw, fonts, config, article_data, content_start_y)
-            
-            # Add final touches
-            self._add_final_touches(draw, config)
+            # Body line pitch (font height plus leading), measured once per render
+            line_height = self._font_height(fonts['body'], draw) + 4
+            self.draw_columns(image, draw, fonts, config, article_data, content_start_y, line_height)
             
             # Convert to bytes
             img_byte_arr = io.BytesIO()
-            image.save(img_byte_arr, format='PNG', quality=95, optimize=True)
+            if CLIPPING_FORMAT == 'WEBP':
+                image.save(img_byte_arr, format='WEBP', quality=85, method=4)
+            else:
+                # Flat two-tone page: low zlib effort costs little size and saves most of the encode time
+                image.save(img_byte_arr, format='PNG', compress_level=1, optimize=False)
             
             logger.info(f"Successfully created {layout_type.name} newspaper clipping")
-            return img_byte_arr.getvalue()
+            clipping = img_byte_arr.getvalue()
+            with self._clipping_cache_lock:
+                self._clipping_cache[cache_key] = clipping
+                while len(self._clipping_cache) > CLIPPING_CACHE_SIZE:
+                    self._clipping_cache.popitem(last=False)
+            return clipping
             
         except Exception as e:
             logger.error(f"Error creating enhanced newspaper clipping: {str(e)}")
             return None
 
+    def _base_canvas(self, layout_type: LayoutType) -> Image.Image:
+        """Blank page for a layout with the aging effect and corner marks drawn, built once and copied per render
+        
+        The corner marks are black and only the black top rule or headline can
+        overlap them, so drawing them first gives the same result as drawing them last.
+        """
+        canvas = self._base_canvases.get(layout_type)
+        if canvas is None:
+            config = self.layouts[layout_type]
+            canvas = Image.new('RGB', (config.width, config.height), '#fefefe')
+            canvas_draw = ImageDraw.Draw(canvas)
+            self._add_aging_effect(canvas_draw, config)
+            self._add_final_touches(canvas_draw, config)
+            self._base_canvases[layout_type] = canvas
+        return canvas
+    
+    def _page_image(self, layout_type: LayoutType) -> Image.Image:
+        """This thread's reusable page image for a layout, reset to the base canvas"""
+        pool = getattr(self._image_pool, 'images', None)
+        if pool is None:
+            pool = self._image_pool.images = {}
+        
+        base = self._base_canvas(layout_type)
+        image = pool.get(layout_type)
+        if image is None:
+            image = pool[layout_type] = base.copy()
+        else:
+            image.paste(base)
+        return image
+    
     def _add_aging_effect(self, draw: ImageDraw, config: LayoutConfig):
-        """Add subtle aging effects to make it look like a real newspaper clipping"""
-        # Add slight shadow/border effect
+        """Add subtle aging effects to make it look like a real newspaper clipping
+        
+        The canvas is created in the page colour, so only the thin shadow bands,
+        the two background corners they leave, and the page outline are drawn.
+        """
         shadow_offset = 5
+        page_right = config.width - shadow_offset
+        page_bottom = config.height - shadow_offset
+        
+        # Drop shadow along the right and bottom edges
+        draw.rectangle([
+            (page_right + 1, shadow_offset), 
+            (config.width, config.height)
+        ], fill='#e0e0e0')
         draw.rectangle([
-            (shadow_offset, shadow_offset), 
+            (shadow_offset, page_bottom + 1), 
             (config.width, config.height)
         ], fill='#e0e0e0')
         
-        # Main newspaper background
+        # Background showing past the ends of the shadow
+        draw.rectangle([
+            (page_right + 1, 0), 
+            (config.width, shadow_offset - 1)
+        ], fill='#fafafa')
+        draw.rectangle([
+            (0, page_bottom + 1), 
+            (shadow_offset - 1, config.height)
+        ], fill='#fafafa')
+        
+        # Page border
         draw.rectangle([
             (0, 0), 
-            (config.width - shadow_offset, config.height - shadow_offset)
-        ], fill='#fefefe', outline='#d0d0d0', width=1)
+            (page_right, page_bottom)
+        ], outline='#d0d0d0', width=1)
 
     def _add_final_touches(self, draw: ImageDraw, config: LayoutConfig):
         """Add final decorative touches"""
@@ -456,29 +857,26 @@ def download_image(image_url: str, output_dir: str, storage_manager: StorageMana
         if not filename:
             filename = f"image_{int(time.time())}.jpg"
         
-        # Download image
-        response = requests.get(image_url, stream=True, timeout=10)
-        response.raise_for_status()
-        
-        # Get image data
-        image_data = b''
-        for chunk in response.iter_content(chunk_size=8192):
-            image_data += chunk
-        
-        if storage_manager:
-            # Use storage manager for project-based storage
-            source = parsed_url.netloc.replace('www.', '')
-            image_filename = f"images/{source}/{filename}"
-            storage_manager.store_file(image_filename, image_data)
-            output_path = storage_manager.get_project_path(image_filename)
-            logger.info(f"Successfully stored image using StorageManager: {output_path}")
-        else:
-            # Fallback to local storage
-            os.makedirs(output_dir, exist_ok=True)
-            output_path = os.path.join(output_dir, filename)
-            with open(output_path, 'wb') as f:
-                f.write(image_data)
-            logger.info(f"Successfully downloaded image to {output_path}")
+        # Download image, reading the body straight off the socket
+        with _SESSION.get(image_url, stream=True, timeout=10) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            
+            if storage_manager:
+                # Use storage manager for project-based storage
+                image_data = response.raw.read()
+                source = parsed_url.netloc.replace('www.', '')
+                image_filename = f"images/{source}/{filename}"
+                storage_manager.store_file(image_filename, image_data)
+                output_path = storage_manager.get_project_path(image_filename)
+                logger.info(f"Successfully stored image using StorageManager: {output_path}")
+            else:
+                # Fallback to local storage
+                os.makedirs(output_dir, exist_ok=True)
+                output_path = os.path.join(output_dir, filename)
+                with open(output_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=64 * 1024)
+                logger.info(f"Successfully downloaded image to {output_path}")
         
         return output_path
         
@@ -500,29 +898,23 @@ def extract_from_url(url, project_name: str = "default"):
     logger.info(f"Starting extraction from URL: {url}")
     
     try:
-        # Configure request headers to mimic a browser
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-        
         logger.debug(f"Sending HTTP request to: {url}")
         start_time = time.time()
-        response = requests.get(url, headers=headers, timeout=10)
+        with _SESSION.get(url, timeout=(3, 10), stream=True) as response:
+            # Check for HTTP errors
+            response.raise_for_status()
+            logger.info(f"Request successful: HTTP {response.status_code}")
+            
+            # Read a bounded amount of the body instead of buffering arbitrarily large pages
+            page_content = response.raw.read(MAX_PAGE_BYTES, decode_content=True)
         request_time = time.time() - start_time
         logger.debug(f"Request completed in {request_time:.2f} seconds")
-        
-        # Check for HTTP errors
-        response.raise_for_status()
-        logger.info(f"Request successful: HTTP {response.status_code}")
+        if len(page_content) >= MAX_PAGE_BYTES:
+            logger.warning(f"Page body truncated at {MAX_PAGE_BYTES} bytes: {url}")
         
         # Parse the HTML content
-        logger.debug("Parsing HTML content with BeautifulSoup")
-        soup = BeautifulSoup(response.content, 'html.parser')
+        logger.debug(f"Parsing HTML content with BeautifulSoup ({HTML_PARSER})")
+        soup = BeautifulSoup(page_content, HTML_PARSER)
         
         # Extract headline - try multiple selectors with domain-specific logic
         logger.debug("Extracting headline")
@@ -533,36 +925,12 @@ def extract_from_url(url, project_name: str = "default"):
         domain = parsed_url.netloc.lower()
         
         # ESPN-specific selectors (to avoid grabbing scores)
-        if 'espn.com' in domain:
-            headline_selectors = [
-                'header.article-header h1',  # ESPN article headlines - primary selector
-                '.article-header h1',
-                'h1[data-module="Headline"]',  # ESPN article headlines
-                'h1.headline',
-                'article h1',
-                '.story-headline',
-                'h1.ContentHeader__Headline',  # ESPN content header
-                'header h1',
-                'h1'
-            ]
-        else:
-            # Default selectors for other sites
-            headline_selectors = [
-                'h1', 
-                'article h1',
-                '.article-header h1', 
-                '.article-headline',
-                '.headline',
-                '.story-headline',
-                'header h1'
-            ]
-        
-        for selector in headline_selectors:
-            headline_elem = soup.select_one(selector)
-            if headline_elem:
-                headline = headline_elem.text.strip()
-                logger.debug(f"Found headline using selector '{selector}': {headline}")
-                break
+        headline_selectors = _ESPN_HEADLINE_SELECTORS if 'espn.com' in domain else _HEADLINE_SELECTORS
+        
+        selector, headline_elem = _select_first(soup, headline_selectors)
+        if headline_elem:
+            headline = headline_elem.text.strip()
+            logger.debug(f"Found headline using selector '{selector}': {headline}")
                 
         if not headline:
             logger.warning("Could not find headline with standard selectors")
@@ -580,34 +948,22 @@ def extract_from_url(url, project_name: str = "default"):
         # Extract date - Multiple formats possible
         logger.debug("Extracting date")
         date_text = "Unknown Date"
-        date_selectors = [
-            'span.timestamp', 
-            '.article-meta', 
-            '.pub-date',
-            '.article-date',
-            'time',
-            '.date',
-            '.published-date',
-            'meta[property="article:published_time"]'
-        ]
-        
-        for selector in date_selectors:
-            date_element = soup.select_one(selector)
-            if date_element:
-                # Handle both content and meta tags
-                if date_element.name == 'meta':
-                    date_text = date_element.get('content', '').strip()
-                else:
-                    date_text = date_element.text.strip()
-                
-                logger.debug(f"Found date using selector '{selector}': {date_text}")
-                
-                # Try to extract just the date part with regex
-                date_match = re.search(r'\w+\s+\d+,\s+\d{4}', date_text)
-                if date_match:
-                    date_text = date_match.group(0)
-                    logger.debug(f"Extracted date format: {date_text}")
-                break
+        
+        selector, date_element = _select_first(soup, _DATE_SELECTORS)
+        if date_element:
+            # Handle both content and meta tags
+            if date_element.name == 'meta':
+                date_text = date_element.get('content', '').strip()
+            else:
+                date_text = date_element.text.strip()
+            
+            logger.debug(f"Found date using selector '{selector}': {date_text}")
+            
+            # Try to extract just the date part with regex
+            date_match = _DATE_RE.search(date_text)
+            if date_match:
+                date_text = date_match.group(0)
+                logger.debug(f"Extracted date format: {date_text}")
                 
         logger.info(f"Extracted date: {date_text}")
         
@@ -616,47 +972,19 @@ def extract_from_url(url, project_name: str = "default"):
         author = "Unknown Author"
         
         # TheAthletic.com specific selectors
-        if 'theathletic.com' in domain:
-            author_selectors = [
-                '#articleByLineString',  # Athletic byline string ID (stable)
-                'span[id="articleByLineString"]',  # More specific ID selector
-                'span[class*="Article_BylineString"]',  # Partial class match for byline string
-                'span[class*="BylineString"]',  # Even more flexible partial match
-                '[data-testid="author-name"]',  # Athletic specific test ID
-                '.author-name',
-                '.byline-author',
-                '.article-author',
-                'a[href*="/author/"]',  # Author link pattern
-                '.author',
-                '.byline',
-                'meta[name="author"]'
-            ]
-        else:
-            # Default selectors for other sites
-            author_selectors = [
-                '.author', 
-                '.byline',
-                '.author-name',
-                '.article-meta .name',
-                '.writer',
-                'meta[name="author"]',
-                '.contributor',
-                '.contributor__text--name'
-            ]
-        
-        for selector in author_selectors:
-            author_element = soup.select_one(selector)
-            if author_element:
-                # Handle both content and meta tags
-                if author_element.name == 'meta':
-                    author = author_element.get('content', '').strip()
-                else:
-                    author = author_element.text.strip()
-                
-                # Clean up common prefixes
-                author = re.sub(r'^By\s+', '', author, flags=re.IGNORECASE)
-                logger.debug(f"Found author using selector '{selector}': {author}")
-                break
+        author_selectors = _ATHLETIC_AUTHOR_SELECTORS if 'theathletic.com' in domain else _AUTHOR_SELECTORS
+        
+        selector, author_element = _select_first(soup, author_selectors)
+        if author_element:
+            # Handle both content and meta tags
+            if author_element.name == 'meta':
+                author = author_element.get('content', '').strip()
+            else:
+                author = author_element.text.strip()
+            
+            # Clean up common prefixes
+            author = _BYLINE_PREFIX_RE.sub('', author)
+            logger.debug(f"Found author using selector '{selector}': {author}")
                 
         logger.info(f"Extracted author: {author}")
         
@@ -665,82 +993,55 @@ def extract_from_url(url, project_name: str = "default"):
         content = ""
         
         # Try multiple selectors for article body
-        content_selectors = [
-            '.article-body',
-            '#story-body',
-            '.story-content',
-            '[data-article-id]',
-            '.article__content',
-            'article',
-            '.post-content',
-            '.entry-content',
-            '.content'
-        ]
-        
-        article_body = None
-        for selector in content_selectors:
-            article_body = soup.select_one(selector)
-            if article_body:
-                logger.debug(f"Found article body using selector '{selector}'")
-                break
+        selector, article_body = _select_first(soup, _CONTENT_SELECTORS)
+        if article_body:
+            logger.debug(f"Found article body using selector '{selector}'")
         
         if article_body:
-            # Extract content with better styling preservation
-            content_elements = []
+            # Build the structured content and the indented plain-text paragraphs in one pass
+            structured_content = []
+            content_paragraphs = []
+            add_structured = structured_content.append
+            add_paragraph = content_paragraphs.append
+            skip_text = _AD_RE.search
             
             # Process all content elements including paragraphs, blockquotes, lists
             for element in article_body.find_all(['p', 'blockquote', 'ul', 'ol', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
                 text = element.get_text().strip()
                 
                 # Skip very short paragraphs or known ad/promo text
-                if len(text) < 20 or any(skip in text.lower() for skip in ['advertisement', 'subscribe', 'privacy policy', 'cookie policy', 'terms of use']):
+                if len(text) < 20 or skip_text(text):
                     continue
                 
-                # Preserve element type for later processing
-                element_data = {
-                    'type': element.name,
-                    'text': text,
-                    'class': element.get('class', []),
-                    'style': element.get('style', '')
-                }
-                
-                # Check for indentation or special styling
-                if 'indent' in str(element.get('class', [])).lower() or 'margin' in element.get('style', ''):
-                    element_data['indented'] = True
-                
-                content_elements.append(element_data)
-            
-            logger.debug(f"Found {len(content_elements)} content elements in article body")
-            
-            # Convert to structured content format
-            structured_content = []
-            for elem in content_elements:
-                if elem['type'] == 'blockquote':
-                    structured_content.append({
+                tag = element.name
+                if tag == 'blockquote':
+                    add_structured({
                         'type': 'blockquote',
-                        'text': elem['text']
+                        'text': text
                     })
-                elif elem['type'] in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                    structured_content.append({
+                elif tag in _HEADING_TAGS:
+                    add_structured({
                         'type': 'heading',
-                        'text': elem['text'],
-                        'level': int(elem['type'][1])
+                        'text': text,
+                        'level': int(tag[1])
                     })
                 else:
-                    structured_content.append({
+                    # Check for indentation or special styling
+                    add_structured({
                         'type': 'paragraph',
-                        'text': elem['text'],
-                        'indented': elem.get('indented', False)
+                        'text': text,
+                        'indented': ('indent' in str(element.get('class', [])).lower()
+                                     or 'margin' in element.get('style', ''))
                     })
+                
+                # Also store original content for backward compatibility with manual indentation
+                # (4 spaces at the beginning of each paragraph)
+                indented_text = '    ' + text
+                add_paragraph(indented_text)
+                logger.info(f"INDENT_DEBUG_STEP1: Paragraph {len(content_paragraphs)} - Original: '{text[:50]}...'")
+                logger.info(f"INDENT_DEBUG_STEP1: Paragraph {len(content_paragraphs)} - After indentation: '{indented_text[:54]}...'")
             
-            # Also store original content for backward compatibility with manual indentation
-            content_paragraphs = []
-            for i, elem in enumerate(content_elements):
-                # Add manual indentation (4 spaces) at the beginning of each paragraph
-                indented_text = '    ' + elem['text']
-                content_paragraphs.append(indented_text)
-                logger.info(f"INDENT_DEBUG_STEP1: Paragraph {i+1} - Original: '{elem['text'][:50]}...'")
-                logger.info(f"INDENT_DEBUG_STEP1: Paragraph {i+1} - After indentation: '{indented_text[:54]}...'")
+            logger.debug(f"Found {len(content_paragraphs)} content elements in article body")
             content = "\n\n".join(content_paragraphs)
             logger.info(f"INDENT_DEBUG_STEP1: Final content has {len(content_paragraphs)} paragraphs")
             logger.info(f"INDENT_DEBUG_STEP1: Content preview:\n{content[:500]}...")
@@ -753,10 +1054,10 @@ def extract_from_url(url, project_name: str = "default"):
             # Filter out very short paragraphs that are likely not main content and add indentation
             content_paragraphs = []
             for p in all_paragraphs:
-                if len(p.text.strip()) > 40:
+                text = p.text.strip()
+                if len(text) > 40:
                     # Add manual indentation (4 spaces) at the beginning of each paragraph
-                    indented_text = '    ' + p.text.strip()
-                    content_paragraphs.append(indented_text)
+                    content_paragraphs.append('    ' + text)
             content = "\n\n".join(content_paragraphs)
             logger.debug(f"Fallback extraction found {len(content_paragraphs)} paragraphs")
         
@@ -788,17 +1089,15 @@ def extract_from_url(url, project_name: str = "default"):
                 return False
             
             # Skip obvious non-images
-            skip_patterns = ['pixel', 'spacer', 'tracking', 'icon', 'favicon', 'logo']
-            if any(pattern in url.lower() for pattern in skip_patterns):
+            if _NON_IMAGE_URL_RE.search(url):
                 return False
             
             # Skip very small images based on filename hints
-            size_hints = ['16x16', '32x32', '48x48', '64x64', '150x150', 'thumb', 'small']
-            if any(hint in url.lower() for hint in size_hints):
+            if _SMALL_IMAGE_HINT_RE.search(url):
                 return False
                 
             # Must be reasonable length and format
-            if not (len(url) > 10 and any(ext in url.lower() for ext in ['.jpg', '.jpeg', '.png', '.webp', '.gif', 'image'])):
+            if not (len(url) > 10 and _IMAGE_URL_HINT_RE.search(url)):
                 return False
             
             # Check actual image size by making a HEAD request
@@ -806,7 +1105,7 @@ def extract_from_url(url, project_name: str = "default"):
                 headers = {
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 }
-                response = requests.head(url, headers=headers, timeout=5)
+                response = _SESSION.head(url, headers=headers, timeout=5)
                 
                 # Check file size (skip very small files)
                 content_length = response.headers.get('content-length')
@@ -830,8 +1129,8 @@ def extract_from_url(url, project_name: str = "default"):
                 return True
         
         # Try meta tags first (most reliable)
-        for meta_selector in ['meta[property="og:image"]', 'meta[name="twitter:image"]']:
-            meta_tag = soup.select_one(meta_selector)
+        for _, compiled in _META_IMAGE_SELECTORS:
+            meta_tag = compiled.select_one(soup)
             if meta_tag:
                 image_url = get_image_url_from_element(meta_tag)
                 if is_valid_image_url(image_url):
@@ -841,11 +1140,8 @@ def extract_from_url(url, project_name: str = "default"):
         # If no meta image found, look for content images
         if not image_url:
             # Use broader selectors to catch more image structures
-            content_selectors = ['article img', '.content img', '.story img', 'main img']
-            
-            for selector in content_selectors:
-                images = soup.select(selector)
-                for img in images:
+            for _, compiled in _CONTENT_IMAGE_SELECTORS:
+                for img in compiled.iselect(soup):
                     candidate_url = get_image_url_from_element(img)
                     if is_valid_image_url(candidate_url):
                         image_url = candidate_url
@@ -894,7 +1190,9 @@ def extract_from_url(url, project_name: str = "default"):
             
             # Apply paragraph formatting using LLM or fallback methods
             logger.info(f"INDENT_DEBUG_STEP2: Before paragraph formatting:\n{content[:500]}...")
-            formatted_content = format_article_paragraphs(content, context)
+            # The formatter may call the OpenAI API; cap concurrent calls under batch extraction
+            with _FORMATTER_SEMAPHORE:
+                formatted_content = format_article_paragraphs(content, context)
             
             if formatted_content and formatted_content != content:
                 logger.info(f"Applied paragraph formatting to URL content (original: {len(content)} chars, formatted: {len(formatted_content)} chars)")
@@ -946,8 +1244,8 @@ def extract_from_url(url, project_name: str = "default"):
         clean_source = source.replace('.', '_').replace('-', '_')
         
         # Clean and format the headline
-        safe_headline = re.sub(r'[^\w\s-]', '', headline_text)
-        safe_headline = re.sub(r'\s+', '_', safe_headline)
+        safe_headline = _FILENAME_UNSAFE_RE.sub('', headline_text)
+        safe_headline = _WHITESPACE_RE.sub('_', safe_headline)
         safe_headline = safe_headline[:50]  # Allow longer headlines but still limit length
         
         # Create the filename
@@ -988,4 +1286,27 @@ def extract_from_url(url, project_name: str = "default"):
     except Exception as e:
         # Handle all other errors
         logger.exception(f"Unexpected error during extraction: {str(e)}")
-        return {"success": False, "error": f"Extraction error: {str(e)}"}
\ No newline at end of file
+        return {"success": False, "error": f"Extraction error: {str(e)}"}
+
+def extract_from_urls(urls: List[str], project_name: str = "default", max_workers: int = 4) -> List[dict]:
+    """
+    Extract several articles concurrently
+    
+    Each URL goes through extract_from_url on a worker thread, sharing _SESSION's
+    connection pool. Page fetches overlap freely; the paragraph-formatter (LLM)
+    step is further limited to FORMATTER_MAX_CONCURRENCY calls at a time.
+    
+    Args:
+        urls (List[str]): The article URLs to extract
+        project_name (str): The project name for organizing storage
+        max_workers (int): Maximum number of articles fetched at once
+        
+    Returns:
+        List[dict]: One result per URL, in the same order as urls
+    """
+    if not urls:
+        return []
+    
+    logger.info(f"Starting batch extraction of {len(urls)} URLs with up to {max_workers} workers")
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        return list(executor.map(lambda url: extract_from_url(url, project_name=project_name), urls))
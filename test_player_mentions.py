@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Player Mention Test Script
+Check ContentAnalyzer.check_player_mentions against overlapping name variations
+"""
+
+from extractors.newspapers_extractor import ContentAnalyzer
+
+def test_middle_name_initial_and_last_name():
+    """First name + last initial must not hide the last name that follows it"""
+    analyzer = ContentAnalyzer()
+
+    assert analyzer.check_player_mentions("Juan Ortiz homered", "Juan Carlos Ortiz") == (True, ['ortiz', 'juan o'])
+    assert analyzer.check_player_mentions("Mary Smith won", "Mary Ann Smith") == (True, ['smith', 'mary s'])
+
+def test_full_name_reports_every_variation():
+    """A full-name hit also reports the last name and first name + last initial"""
+    analyzer = ContentAnalyzer()
+
+    assert analyzer.check_player_mentions("Juan Ortiz homered", "Juan Ortiz") == (True, ['Juan Ortiz', 'ortiz', 'juan o'])
+    assert analyzer.check_player_mentions("No names here", "Juan Ortiz") == (False, [])
+
+if __name__ == "__main__":
+    test_middle_name_initial_and_last_name()
+    test_full_name_reports_every_variation()
+    print("✅ Player mention tests passed")
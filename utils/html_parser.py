@@ -0,0 +1,17 @@
+"""
+BeautifulSoup parser selection shared by the extractors.
+
+lxml is a declared dependency and is several times faster than the stdlib
+html.parser on full article and search-result pages. The stdlib parser is
+only used when lxml cannot be imported, so extraction keeps working in
+environments where it failed to install.
+"""
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Parser name to pass to BeautifulSoup(...)
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'